@@ -1,10 +1,24 @@
+# compare_tfvars.py runs on its own, without compare_vars.py next to it, so the
+# helpers it shares with compare_vars.py, the tfvars parse cache and strictly_equal,
+# are duplicated there verbatim; keep both copies in sync.
 import os
+import re
+import functools
+import hashlib
+import importlib.metadata
+import tempfile
 import hcl2
-from deepdiff import DeepDiff
 import json
 import sys
 import logging
 
+# orjson is optional: it is much faster for the per-row JSON dumps, but the
+# stdlib encoder is used whenever it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -19,11 +33,83 @@ environment_specific_keys = [
     "arn"
 ]
 
+# Parsed tfvars are cached here as JSON, never pickle, so a writable cache directory
+# cannot run code; entries are keyed by the file content and the python-hcl2 version
+_PARSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "env-compare")
+# Entries kept after each store; the least recently used are removed first
+_PARSE_CACHE_MAX_ENTRIES = 64
+
+try:
+    _HCL2_VERSION = hcl2.__version__
+except AttributeError:
+    _HCL2_VERSION = importlib.metadata.version("python-hcl2")
+
+def _parse_cache_path(raw):
+    """Return the cache entry path for raw .tfvars content under the installed parser"""
+    key = hashlib.sha1(_HCL2_VERSION.encode() + b"\0" + raw).hexdigest()
+    return os.path.join(_PARSE_CACHE_DIR, f"tfvars-{key}.json")
+
+def _load_cached_parse(cache_path):
+    try:
+        with open(cache_path, "rb") as cache_file:
+            data = json.loads(cache_file.read())
+        # Mark the entry as recently used so pruning keeps it
+        os.utime(cache_path)
+        return data
+    except (OSError, ValueError):
+        # Missing or truncated entries are simply re-parsed
+        return None
+
+def _prune_parse_cache():
+    """Remove the least recently used entries beyond _PARSE_CACHE_MAX_ENTRIES"""
+    try:
+        entries = [
+            (entry.stat().st_mtime_ns, entry.path)
+            for entry in os.scandir(_PARSE_CACHE_DIR)
+            # Older versions cached pickles; sweep those out too
+            if entry.name.endswith((".json", ".pkl"))
+        ]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[_PARSE_CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _store_cached_parse(cache_path, data):
+    try:
+        # The entries hold configuration values, so keep them private to the user
+        os.makedirs(_PARSE_CACHE_DIR, mode=0o700, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=_PARSE_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(data, cache_file)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug(f"Could not cache parsed {cache_path}: {str(e)}")
+        return
+    _prune_parse_cache()
+
+def _parse_tfvars_file(file_path):
+    """Parse a .tfvars file, reusing the cached result for unchanged content"""
+    with open(file_path, "rb") as file:
+        raw = file.read()
+    cache_path = _parse_cache_path(raw)
+    data = _load_cached_parse(cache_path)
+    if data is None:
+        data = hcl2.loads(raw.decode("utf-8"))
+        _store_cached_parse(cache_path, data)
+    return data
+
 def parse_tfvars(file_path):
     try:
-        with open(file_path, 'r') as file:
-            data = hcl2.load(file)
-            return data
+        return _parse_tfvars_file(file_path)
     except FileNotFoundError:
         logging.error(f"File not found: {file_path}")
         sys.exit(1)
@@ -31,131 +117,251 @@ def parse_tfvars(file_path):
         logging.error(f"Error parsing {file_path}: {str(e)}")
         sys.exit(1)
 
-def is_environment_specific(key, env1='', env2=''):
-    environment_indicators = [env1.lower(), env2.lower(), "acnt", "acpt", "cont", "dev1", "prod"]
+# Environment name indicators
+_ENV_NAME_INDICATORS = ("acnt", "acpt", "cont", "dev1", "prod")
+
+def get_environment_indicators(env1='', env2=''):
+    """Return every substring that marks a key as environment specific, built once per comparison"""
+    return tuple(dict.fromkeys(
+        (env1.lower(), env2.lower(), *_ENV_NAME_INDICATORS, *environment_specific_keys)
+    ))
+
+@functools.lru_cache(maxsize=None)
+def _indicator_pattern(env_indicators):
+    """Compile the indicators into one alternation so a key is scanned once"""
+    return re.compile("|".join(map(re.escape, env_indicators)))
 
-    if any(indicator in key.lower() for indicator in environment_indicators):
+def is_environment_specific(key_lower, env_indicators):
+    """Check an already lowercased key against the environment indicators"""
+    return _indicator_pattern(env_indicators).search(key_lower) is not None
+
+def _holds_type(value, scalar_types):
+    """Return True if value is, or nests, an instance of scalar_types"""
+    if isinstance(value, scalar_types):
         return True
+    if isinstance(value, dict):
+        return any(_holds_type(item, scalar_types) for item in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return any(_holds_type(item, scalar_types) for item in value)
+    return False
 
-    # Check if the key belongs to the environment-specific keys array
-    if any(es_key in key.lower() for es_key in environment_specific_keys):
+def strictly_equal(value1, value2):
+    """Return True when two values are equal with matching types at every level, so 1, 1.0 and True stay apart"""
+    value_type = type(value1)
+    if value_type is not type(value2):
+        return False
+    if value_type is dict:
+        if len(value1) != len(value2):
+            return False
+        for key, item in value1.items():
+            if key not in value2 or not strictly_equal(item, value2[key]):
+                return False
         return True
+    if value_type is list or value_type is tuple:
+        return len(value1) == len(value2) and all(map(strictly_equal, value1, value2))
+    return value1 == value2
 
-    return False
+def _dumps(value):
+    """Serialize a value as 2-space indented JSON, preferring orjson when available"""
+    # orjson writes NaN/Infinity as null and formats floats differently
+    # (1e16 vs 1e+16), so values holding floats keep the json rendering
+    if orjson is not None and not _holds_type(value, float):
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. non-str keys, huge ints) go through json
+            pass
+    return json.dumps(value, indent=2)
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, default=str)
 
-def extract_diff(diff, value1, value2, key_path):
-    def format_key(path):
-        return path.replace("root.", "").replace("[", ".").replace("]", "").replace("", "")
+def same_items_ignoring_order(old_list, new_list):
+    """Check whether two lists hold the same items, in any order"""
+    if len(old_list) != len(new_list):
+        return False
+    return sorted(map(_canonical, old_list)) == sorted(map(_canonical, new_list))
 
-    def handle_nested_diffs(old_value, new_value, base_key=""):
-        diffs = []
+# Report format, which differs from the earlier DeepDiff-based reports:
+# - paths are dotted and unquoted (root.id.0.name, not root.'id'.0.'name')
+# - lines follow the walk order (env1's keys, then keys only in env2; list
+#   items by index) instead of changed values, then removed, then added items
+# - every change is reported, including added or removed keys next to
+#   changed values, rather than a single whole-value "old => new" line
+def iter_nested_diffs(old_value, new_value, base_key="root"):
+    """Yield a "key: old => new" line for every difference, treating lists as unordered"""
+    # Explicit stack instead of recursion: entries are either pending
+    # (old, new, key) walks or finished diff lines, popped in report order
+    stack = [(old_value, new_value, base_key)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+            continue
+        old_value, new_value, base_key = item
+        pending = []
         if isinstance(old_value, dict) and isinstance(new_value, dict):
             for k, v in old_value.items():
-                if k in new_value and new_value[k] != v:
-                    nested_key = f"{base_key}.{k}" if base_key else k
-                    diffs.extend(handle_nested_diffs(v, new_value[k], nested_key))
+                if k in new_value and not strictly_equal(v, new_value[k]):
+                    pending.append((v, new_value[k], f"{base_key}.{k}"))
                 elif k not in new_value:
-                    nested_key = f"{base_key}.{k}" if base_key else k
-                    diffs.append(f"{nested_key}: {v} was removed")
+                    pending.append(f"{base_key}.{k}: {v} was removed")
             for k, v in new_value.items():
                 if k not in old_value:
-                    nested_key = f"{base_key}.{k}" if base_key else k
-                    diffs.append(f"{nested_key}: {v} was added")
+                    pending.append(f"{base_key}.{k}: {v} was added")
         elif isinstance(old_value, list) and isinstance(new_value, list):
+            if same_items_ignoring_order(old_value, new_value):
+                continue
             for i, (old_item, new_item) in enumerate(zip(old_value, new_value)):
-                if old_item != new_item:
-                    nested_key = f"{base_key}[{i}]" if base_key else str(i)
-                    diffs.extend(handle_nested_diffs(old_item, new_item, nested_key))
+                if not strictly_equal(old_item, new_item):
+                    pending.append((old_item, new_item, f"{base_key}.{i}"))
             if len(old_value) < len(new_value):
                 for i in range(len(old_value), len(new_value)):
-                    nested_key = f"{base_key}[{i}]" if base_key else str(i)
-                    diffs.append(f"{nested_key}: {new_value[i]} was added")
+                    pending.append(f"{base_key}.{i}: {new_value[i]} was added")
             elif len(old_value) > len(new_value):
                 for i in range(len(new_value), len(old_value)):
-                    nested_key = f"{base_key}[{i}]" if base_key else str(i)
-                    diffs.append(f"{nested_key}: {old_value[i]} was removed")
+                    pending.append(f"{base_key}.{i}: {old_value[i]} was removed")
         else:
-            diffs.append(f"{base_key}: {old_value} => {new_value}")
-        return diffs
-
-    if "values_changed" in diff:
-        changes = diff["values_changed"]
-        diffs = []
-        for path, change in changes.items():
-            old_value = change["old_value"]
-            new_value = change["new_value"]
-            key = format_key(path)
-            diffs.extend(handle_nested_diffs(old_value, new_value, key))
-        return "\\n".join(diffs)
-    elif "iterable_item_removed" in diff or "iterable_item_added" in diff:
-        diffs = []
-        for change_type in ["iterable_item_removed", "iterable_item_added"]:
-            if change_type in diff:
-                for path, change in diff[change_type].items():
-                    key = format_key(path)
-                    diffs.append(f"{key}: {change} was {change_type.replace('iterable_item_', '')}")
-        return "\\n".join(diffs)
-    else:
-        return f"{value1} => {value2}"
+            yield f"{base_key}: {old_value} => {new_value}"
+            continue
+        stack.extend(reversed(pending))
+
+# Serialized form of the "undefined" placeholder shown for missing keys
+_UNDEFINED_JSON = json.dumps("undefined", indent=2)
+
+# Columns of the comparison results; each holds one entry per row
+_RESULT_COLUMNS = ("keys", "v1s", "v2s", "diffs", "classes", "statuses")
+
+def _compare_keys(all_keys, lower_keys, data1, data2, env1, env2):
+    """Compare data1 and data2 over all_keys, returning the table columns and summary counts"""
+    comparison_results = {column: [] for column in _RESULT_COLUMNS}
+    keys, v1s, v2s, diffs, classes, statuses = (
+        comparison_results[column] for column in _RESULT_COLUMNS
+    )
+    summary = {
+        "equal": 0,
+        "undefined": 0,
+        "red": 0,
+        "blue": 0
+    }
+    env_indicators = get_environment_indicators(env1, env2)
+
+    # data1/data2 stay alive and unmodified for the whole loop, so object ids
+    # are stable keys for values serialized more than once
+    dumps_cache = {}
+
+    def dumps(value):
+        value_json = dumps_cache.get(id(value))
+        if value_json is None:
+            value_json = _dumps(value)
+            dumps_cache[id(value)] = value_json
+        return value_json
+
+    # Keys defined on only one side never need diffing; bucket them up front
+    rows = {}
+    for key in data1.keys() - data2.keys():
+        summary["undefined"] += 1
+        rows[key] = (
+            dumps(data1[key]),
+            _UNDEFINED_JSON,
+            f"{key} is not defined in {env2.upper()}",
+            "yellow",
+            f"Not defined in {env2.upper()}",
+        )
+    for key in data2.keys() - data1.keys():
+        summary["undefined"] += 1
+        rows[key] = (
+            _UNDEFINED_JSON,
+            dumps(data2[key]),
+            f"{key} is not defined in {env1.upper()}",
+            "yellow",
+            f"Not defined in {env1.upper()}",
+        )
+
+    for key in data1.keys() & data2.keys():
+        value1 = data1[key]
+        value2 = data2[key]
+        key_path = key
+
+        # Type-strict equality skips the walk; everything else is walked
+        exact_diff = "" if strictly_equal(value1, value2) else "\\n".join(iter_nested_diffs(value1, value2))
+        if exact_diff:
+            row_class = "blue" if is_environment_specific(lower_keys[key_path], env_indicators) else "red"
+            status = "Values differ but seems fine for different environments, please verify" if row_class == "blue" else "Unexpected difference, please review"
+            summary["blue" if row_class == "blue" else "red"] += 1
+            value1_json = dumps(value1)
+            value2_json = dumps(value2)
+        else:
+            row_class = "equal"
+            status = "Equal"
+            summary["equal"] += 1
+            value1_json = dumps(value1)
+            value2_json = value1_json if value1 is value2 else dumps(value2)
+        rows[key] = (value1_json, value2_json, exact_diff, row_class, status)
+
+    # Lay the buckets back out in the sorted key order
+    for key in all_keys:
+        value1_json, value2_json, exact_diff, row_class, status = rows[key]
+        keys.append(key)
+        v1s.append(value1_json)
+        v2s.append(value2_json)
+        diffs.append(exact_diff)
+        classes.append(row_class)
+        statuses.append(status)
+    return comparison_results, summary
 
 def compare_tfvars_data(data1, data2, env1, env2):
     try:
-        all_keys = set(data1.keys()).union(set(data2.keys()))
-        all_keys = sorted(all_keys, key=str.lower)
-        comparison_results = []
-        summary = {
-            "equal": 0,
-            "undefined": 0,
-            "red": 0,
-            "blue": 0
-        }
-        for key in all_keys:
-            value1 = data1.get(key, "undefined")
-            value2 = data2.get(key, "undefined")
-            key_path = key
-
-            if value1 != "undefined" and value2 != "undefined":
-                diff = DeepDiff(value1, value2, ignore_order=True)
-                if diff:
-                    exact_diff = extract_diff(diff, value1, value2, key_path)
-                    row_class = "blue" if is_environment_specific(key_path, env1, env2) else "red"
-                    status = "Values differ but seems fine for different environments, please verify" if row_class == "blue" else "Unexpected difference, please review"
-                    summary["blue" if row_class == "blue" else "red"] += 1
-                else:
-                    exact_diff = ""
-                    row_class = "equal"
-                    status = "Equal"
-                    summary["equal"] += 1
-            elif value1 == "undefined":
-                exact_diff = f"{key} is not defined in {env1.upper()}"
-                row_class = "yellow"
-                status = f"Not defined in {env1.upper()}"
-                summary["undefined"] += 1
-            else:
-                exact_diff = f"{key} is not defined in {env2.upper()}"
-                row_class = "yellow"
-                status = f"Not defined in {env2.upper()}"
-                summary["undefined"] += 1
-            comparison_results.append((key, json.dumps(value1, indent=2), json.dumps(value2, indent=2), exact_diff, row_class, status))
-        return comparison_results, summary
+        # Lowercase every key once, for both sorting and the environment check
+        lower_keys = {k: k.lower() for k in data1.keys() | data2.keys()}
+        all_keys = sorted(lower_keys, key=lower_keys.__getitem__)
+        return _compare_keys(all_keys, lower_keys, data1, data2, env1, env2)
     except Exception as e:
         logging.error(f"Error during comparison: {str(e)}")
         sys.exit(1)
 
+# Keys, values and diffs repeat across rows, so escaped cells are memoized
+@functools.lru_cache(maxsize=8192)
 def escape_html(text):
-    escape_table = {
-        "&": "&amp;",
-        "\"": "&quot;",
-        "'": "&#x27;",
-        ">": "&gt;",
-        "<": "&lt;"
-    }
-    return "".join(escape_table.get(c, c) for c in text)
+    # Most cells contain nothing to escape; the substring checks avoid any allocation
+    if "&" not in text and "<" not in text and ">" not in text and '"' not in text and "'" not in text:
+        return text
+    # Each str.replace is a C-level scan; "&" must go first so entities stay intact
+    return (
+        text.replace("&", "&amp;")
+        .replace('"', "&quot;")
+        .replace("'", "&#x27;")
+        .replace(">", "&gt;")
+        .replace("<", "&lt;")
+    )
+
+# Template placeholders, substituted together in a single scan of the template;
+# {rows} is handled separately so the rows can be streamed into the output
+_PLACEHOLDER_RE = re.compile(r"\{(summary|env1|env2)\}")
+
+# Table row markup; filled with (row_class, key, value1, value2, exact_diff, status)
+_ROW_FMT = (
+    "<tr class='%s'>"
+    "<td>%s</td>"
+    "<td><pre>%s</pre></td>"
+    "<td><pre>%s</pre></td>"
+    "<td><pre style='word-break: break-all;'>%s</pre></td>"
+    "<td class='status'>%s</td>"
+    "</tr>"
+)
+
+@functools.lru_cache(maxsize=8)
+def _load_template(template_path, mtime_ns):
+    """Read a template once per path; the mtime argument invalidates it on edits"""
+    with open(template_path, 'r') as template_file:
+        return template_file.read()
+
+def escape_diff(text):
+    return escape_html(text).replace("root: ", "")
 
 def write_comparison_to_html(comparison_results, summary, template_path, output_file, env1, env2, branch_name, commit_id, commit_message, file1_path, file2_path):
     try:
-        with open(template_path, 'r') as template_file:
-            template = template_file.read()
+        template = _load_template(template_path, os.stat(template_path).st_mtime_ns)
         summary_html = (
             "<h2>Summary</h2>"
             f"<p><strong>Branch:</strong> {escape_html(branch_name)}</p>"
@@ -166,27 +372,31 @@ def write_comparison_to_html(comparison_results, summary, template_path, output_
             f"<p><strong><span style='color: rgb(241, 83, 83);'>&#9679;</span> Red Variables (Check Required):</strong> {summary['red']}</p>"
             f"<p><strong><span style='color: rgb(26, 179, 230);'>&#9679;</span> Blue Variables (Environment Specific):</strong> {summary['blue']}</p>"
         )
-        rows = ""
-        for key, value1, value2, exact_diff, row_class, status in comparison_results:
-            value1 = escape_html(value1)
-            value2 = escape_html(value2)
-            exact_diff = escape_html(exact_diff).replace("root: ", "")
-            rows += (
-                f"<tr class='{row_class}'>"
-                f"<td>{escape_html(key)}</td>"
-                f"<td><pre>{value1}</pre></td>"
-                f"<td><pre>{value2}</pre></td>"
-                f"<td><pre style='word-break: break-all;'>{exact_diff}</pre></td>"
-                f"<td class='status'>{status}</td>"
-                "</tr>"
-            )
-        html_content = template
-        html_content = html_content.replace("{summary}", summary_html)
-        html_content = html_content.replace("{env1}", env1.upper())
-        html_content = html_content.replace("{env2}", env2.upper())
-        html_content = html_content.replace("{rows}", rows)
+        placeholders = {
+            "summary": summary_html,
+            "env1": env1.upper(),
+            "env2": env2.upper(),
+        }
+
+        def fill(text):
+            return _PLACEHOLDER_RE.sub(lambda m: placeholders[m.group(1)], text)
+
+        prefix, rows_marker, suffix = template.partition("{rows}")
         with open(output_file, 'w') as file:
-            file.write(html_content)
+            file.write(fill(prefix))
+            # Stream each row as it is rendered instead of building the whole table
+            if rows_marker:
+                rows = zip(
+                    comparison_results["classes"],
+                    map(escape_html, comparison_results["keys"]),
+                    map(escape_html, comparison_results["v1s"]),
+                    map(escape_html, comparison_results["v2s"]),
+                    map(escape_diff, comparison_results["diffs"]),
+                    comparison_results["statuses"],
+                )
+                for row in rows:
+                    file.write(_ROW_FMT % row)
+            file.write(fill(suffix))
         logging.info(f"Comparison report successfully written to {output_file}")
     except FileNotFoundError:
         logging.error(f"Template file not found: {template_path}")
@@ -236,4 +446,3 @@ if __name__ == "__main__":
     logging.info(f"env1: {env1}, env2: {env2}, config_directory_path: {config_directory_path}, template_path: {template_path}, output_file: {output_file}, branch: {branch_name}, commit_id: {commit_id}, commit_message: {commit_message}")
 
     main(env1, env2, template_path, output_file, config_directory_path, branch_name, commit_id, commit_message)
-"""
\ No newline at end of file
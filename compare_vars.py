@@ -1,36 +1,71 @@
+# compare_vars.py is deployed on its own (CI copies just this file next to the
+# inputs), so the helpers it shares with compare_tfvars.py, the tfvars parse cache
+# and strictly_equal, are duplicated there verbatim; keep both copies in sync.
+import argparse
 import os
+import re
+import hashlib
+import importlib.metadata
+import functools
+import heapq
+import tempfile
 import hcl2
 from deepdiff import DeepDiff
 import json
 import sys
 import logging
+from collections import OrderedDict, namedtuple
 
-# Setup Logging
+# orjson is optional: it is much faster for the per-row JSON dumps, but the
+# stdlib encoder is used whenever it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Setup Logging; LOG_LEVEL=DEBUG also prints the parsed command-line arguments
+_LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    # An unknown LOG_LEVEL falls back to INFO rather than failing at import
+    level=logging.getLevelNamesMapping().get(_LOG_LEVEL, logging.INFO),
+    format="%(asctime)s - %(levelname)s - %(message)s",
 )
+if _LOG_LEVEL not in logging.getLevelNamesMapping():
+    logging.warning(f"Unknown LOG_LEVEL {_LOG_LEVEL!r}, using INFO")
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_id(text):
     """Sanitize text to be used as an ID by replacing invalid characters"""
     return text.replace('/', '-').replace(' ', '-').replace(',', '').replace('(', '').replace(')', '')
 
-# Function to escape HTML characters
+# Function to escape HTML characters; keys, statuses and common values recur
+# across sections and files, so results are memoized
+@functools.lru_cache(maxsize=8192)
 def escape_html(text):
-    escape_table = {
-        "&": "&amp;",
-        '"': "&quot;",
-        "'": "&#x27;",
-        ">": "&gt;",
-        "<": "&lt;",
-    }
-    return "".join(escape_table.get(c, c) for c in text)
+    # Most cells contain nothing to escape; the substring checks avoid any allocation
+    if "&" not in text and "<" not in text and ">" not in text and '"' not in text and "'" not in text:
+        return text
+    # Each str.replace is a C-level scan; "&" must go first so entities stay intact
+    return (
+        text.replace("&", "&amp;")
+        .replace('"', "&quot;")
+        .replace("'", "&#x27;")
+        .replace(">", "&gt;")
+        .replace("<", "&lt;")
+    )
 
 # Function to parse .json files
 def parse_json(file_path):
     try:
-        with open(file_path, "r") as file:
-            data = json.load(file)
-            return data
+        with open(file_path, "rb") as file:
+            raw = file.read()
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects some input json accepts (NaN, huge ints); let json decide
+                pass
+        return json.loads(raw)
     except FileNotFoundError:
         logging.error(f"File not found: {file_path}")
         sys.exit(1)
@@ -41,12 +76,84 @@ def parse_json(file_path):
         logging.error(f"Error processing {file_path}: {str(e)}")
         sys.exit(1)
 
+# Parsed tfvars are cached here as JSON, never pickle, so a writable cache directory
+# cannot run code; entries are keyed by the file content and the python-hcl2 version
+_PARSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "env-compare")
+# Entries kept after each store; the least recently used are removed first
+_PARSE_CACHE_MAX_ENTRIES = 64
+
+try:
+    _HCL2_VERSION = hcl2.__version__
+except AttributeError:
+    _HCL2_VERSION = importlib.metadata.version("python-hcl2")
+
+def _parse_cache_path(raw):
+    """Return the cache entry path for raw .tfvars content under the installed parser"""
+    key = hashlib.sha1(_HCL2_VERSION.encode() + b"\0" + raw).hexdigest()
+    return os.path.join(_PARSE_CACHE_DIR, f"tfvars-{key}.json")
+
+def _load_cached_parse(cache_path):
+    try:
+        with open(cache_path, "rb") as cache_file:
+            data = json.loads(cache_file.read())
+        # Mark the entry as recently used so pruning keeps it
+        os.utime(cache_path)
+        return data
+    except (OSError, ValueError):
+        # Missing or truncated entries are simply re-parsed
+        return None
+
+def _prune_parse_cache():
+    """Remove the least recently used entries beyond _PARSE_CACHE_MAX_ENTRIES"""
+    try:
+        entries = [
+            (entry.stat().st_mtime_ns, entry.path)
+            for entry in os.scandir(_PARSE_CACHE_DIR)
+            # Older versions cached pickles; sweep those out too
+            if entry.name.endswith((".json", ".pkl"))
+        ]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[_PARSE_CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _store_cached_parse(cache_path, data):
+    try:
+        # The entries hold configuration values, so keep them private to the user
+        os.makedirs(_PARSE_CACHE_DIR, mode=0o700, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=_PARSE_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(data, cache_file)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug(f"Could not cache parsed {cache_path}: {str(e)}")
+        return
+    _prune_parse_cache()
+
+def _parse_tfvars_file(file_path):
+    """Parse a .tfvars file, reusing the cached result for unchanged content"""
+    with open(file_path, "rb") as file:
+        raw = file.read()
+    cache_path = _parse_cache_path(raw)
+    data = _load_cached_parse(cache_path)
+    if data is None:
+        data = hcl2.loads(raw.decode("utf-8"))
+        _store_cached_parse(cache_path, data)
+    return data
+
 # Function to parse .tfvars files
 def parse_tfvars(file_path):
     try:
-        with open(file_path, "r") as file:
-            data = hcl2.load(file)
-            return data
+        return _parse_tfvars_file(file_path)
     except FileNotFoundError:
         logging.error(f"File not found: {file_path}")
         sys.exit(1)
@@ -54,17 +161,31 @@ def parse_tfvars(file_path):
         logging.error(f"Error parsing {file_path}: {str(e)}")
         sys.exit(1)
 
+# Function to list the .properties files in an env directory
+def list_properties_files(dir_path):
+    """Return the set of .properties file names in a directory from a single scandir pass"""
+    with os.scandir(dir_path) as entries:
+        return {entry.name for entry in entries if entry.name.endswith(".properties")}
+
 # Function to parse .properties files
 def parse_properties(file_path):
     try:
+        # One bulk read; text mode turns \r\n and \r into \n, so lines split
+        # exactly where iterating over the file would split them
+        with open(file_path, "r", encoding="utf-8") as file:
+            lines = file.read().split("\n")
         properties = {}
-        with open(file_path, "r") as file:
-            for line in file:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    properties[key.strip()] = value.strip()
-        return properties
+        for line_number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            key, sep, value = line.partition("=")
+            if not sep:
+                # A malformed file must fail the run rather than yield a clean-looking report
+                raise ValueError(f"line {line_number} has no '=' separator: {line}")
+            properties[key.strip()] = value.strip()
+        # Keep keys in case-insensitive order so comparisons can merge them without re-sorting
+        return dict(sorted(properties.items(), key=lambda item: item[0].lower()))
     except FileNotFoundError:
         logging.error(f"File not found: {file_path}")
         sys.exit(1)
@@ -72,81 +193,90 @@ def parse_properties(file_path):
         logging.error(f"Error parsing {file_path}: {str(e)}")
         sys.exit(1)
 
-# Differentiating environment-specific keys
-def is_environment_specific(key, env1, env2, value1=None, value2=None):
-    # Keys that typically differ across environments
-    environment_specific_keys = [
-        "account",
-        "region",
-        "profile",
-        "environment",
-        "env",
-        "url",
-        "endpoint",
-        "database_name",
-        "bucket_name",
-        "s3",
-        "created",
-        "time",
-        "arn",
-        "cidr",
-        "availability_zone",
-        "az",
-        "support",
-        "owner",
-        "delegate",
-        "size",
-        "instance",
-        "storage",
-        "retention",
-        "ami",
-        "key_prefix",
-    ]
-
-    # Resource capacity/sizing related keys
-    capacity_keys = [
-        "min_size",
-        "max_size",
-        "desired",
-        "capacity",
-        "count",
-        "instance_type",
-        "type",
-        "storage",
-        "size",
-        "retention",
-        "concurrency",
-        "errors",
-    ]
-
-    # Configuration flags and versioning
-    config_keys = [
-        "version",
-        "versioning",
-        "multi_az",
-        "enable",
-        "enabled",
-        "feature",
-        "flag",
-    ]
-
-    # Environment name indicators
-    environment_indicators = [env1.lower(), env2.lower(), "prod", "staging", "dev", "acpt", "devl", "test"]
-
-    # Check if key contains environment indicators
-    if any(indicator in key.lower() for indicator in environment_indicators):
-        return True
-
-    # Check if key matches common environment-specific patterns
-    if any(es_key in key.lower() for es_key in environment_specific_keys):
-        return True
+# Keys that typically differ across environments
+_ENV_SPECIFIC_KEYS = frozenset({
+    "account",
+    "region",
+    "profile",
+    "environment",
+    "env",
+    "url",
+    "endpoint",
+    "database_name",
+    "bucket_name",
+    "s3",
+    "created",
+    "time",
+    "arn",
+    "cidr",
+    "availability_zone",
+    "az",
+    "support",
+    "owner",
+    "delegate",
+    "size",
+    "instance",
+    "storage",
+    "retention",
+    "ami",
+    "key_prefix",
+})
+
+# Resource capacity/sizing related keys
+_CAPACITY_KEYS = frozenset({
+    "min_size",
+    "max_size",
+    "desired",
+    "capacity",
+    "count",
+    "instance_type",
+    "type",
+    "storage",
+    "size",
+    "retention",
+    "concurrency",
+    "errors",
+})
+
+# Configuration flags and versioning
+_CONFIG_KEYS = frozenset({
+    "version",
+    "versioning",
+    "multi_az",
+    "enable",
+    "enabled",
+    "feature",
+    "flag",
+})
+
+# Every key pattern that marks a difference as environment specific
+_ENV_KEY_PATTERNS = _ENV_SPECIFIC_KEYS | _CAPACITY_KEYS | _CONFIG_KEYS
+
+# Sizing keys whose numeric differences are expected between environments
+_SIZE_KEYS = ("size", "storage", "retention", "capacity", "count")
+
+# Environment name indicators
+_ENV_NAME_INDICATORS = ("prod", "staging", "dev", "acpt", "devl", "test")
+
+def get_environment_indicators(env1, env2):
+    """Build the lowercased environment indicators once per comparison run"""
+    return (env1.lower(), env2.lower()) + _ENV_NAME_INDICATORS
+
+@functools.lru_cache(maxsize=8)
+def _environment_patterns(env_indicators):
+    """Compile the key and value checks into alternations so each string is scanned once"""
+    indicators = "|".join(map(re.escape, env_indicators))
+    key_patterns = "|".join(map(re.escape, sorted(_ENV_KEY_PATTERNS)))
+    # Keys are matched case-insensitively in place rather than lowercased per call
+    return re.compile(f"{indicators}|{key_patterns}", re.IGNORECASE), re.compile(indicators)
 
-    # Check for capacity/sizing related keys
-    if any(cap_key in key.lower() for cap_key in capacity_keys):
-        return True
+# Differentiating environment-specific keys
+def is_environment_specific(key, env_indicators, value1=None, value2=None):
+    key_re, indicator_re = _environment_patterns(env_indicators)
 
-    # Check for configuration flags
-    if any(cfg_key in key.lower() for cfg_key in config_keys):
+    # Check if key contains environment indicators or matches environment-specific,
+    # capacity or configuration patterns
+    if key_re.search(key):
         return True
 
     # Value-based intelligence: Check if values contain environment indicators
@@ -155,7 +285,7 @@ def is_environment_specific(key, env1, env2, value1=None, value2=None):
         val2_str = str(value2).lower()
 
         # Check if values contain environment names
-        if any(indicator in val1_str or indicator in val2_str for indicator in environment_indicators):
+        if indicator_re.search(val1_str) or indicator_re.search(val2_str):
             return True
 
         # Check if values differ in a pattern suggesting environment differences
@@ -170,20 +300,90 @@ def is_environment_specific(key, env1, env2, value1=None, value2=None):
 
         # Check for numeric differences in sizing (likely environment-specific)
         if isinstance(value1, (int, float)) and isinstance(value2, (int, float)) and value1 != value2:
-            if any(size_key in key.lower() for size_key in ['size', 'storage', 'retention', 'capacity', 'count']):
+            key_l = key.lower()
+            if any(size_key in key_l for size_key in _SIZE_KEYS):
                 return True
 
     return False
 
+# Container types whose element order DeepDiff may need to ignore
+_CONTAINER_TYPES = (dict, list, tuple, set)
+
+# Element types that sort consistently and that DeepDiff hashes by value
+_SORTABLE_SCALAR_TYPES = (str, int, float)
+
+def same_items_ignoring_order(value1, value2):
+    """Return True if two lists hold the same items in any order, False otherwise"""
+    if type(value1) is not list or type(value2) is not list or len(value1) != len(value2):
+        return False
+    element_types = {type(item) for item in value1}
+    element_types.update(type(item) for item in value2)
+    if len(element_types) == 1 and element_types <= set(_SORTABLE_SCALAR_TYPES):
+        return sorted(value1) == sorted(value2)
+    # Lists of dicts/lists, or mixed types: compare sorted canonical JSON, which
+    # keeps 1, 1.0 and true distinct the way DeepDiff does
+    try:
+        canonical1 = sorted(json.dumps(item, sort_keys=True) for item in value1)
+        canonical2 = sorted(json.dumps(item, sort_keys=True) for item in value2)
+    except (TypeError, ValueError):
+        return False
+    return canonical1 == canonical2
+
+def _holds_type(value, scalar_types):
+    """Return True if value is, or nests, an instance of scalar_types"""
+    if isinstance(value, scalar_types):
+        return True
+    if isinstance(value, dict):
+        return any(_holds_type(item, scalar_types) for item in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return any(_holds_type(item, scalar_types) for item in value)
+    return False
+
+def strictly_equal(value1, value2):
+    """Return True when two values are equal with matching types at every level, so 1, 1.0 and True stay apart"""
+    value_type = type(value1)
+    if value_type is not type(value2):
+        return False
+    if value_type is dict:
+        if len(value1) != len(value2):
+            return False
+        for key, item in value1.items():
+            if key not in value2 or not strictly_equal(item, value2[key]):
+                return False
+        return True
+    if value_type is list or value_type is tuple:
+        return len(value1) == len(value2) and all(map(strictly_equal, value1, value2))
+    return value1 == value2
+
+def diff_values(value1, value2):
+    """Return the DeepDiff between two values, or None when they are equal"""
+    if strictly_equal(value1, value2):
+        return None
+    # ignore_order only matters for containers; scalars skip the DeepHash pass
+    if isinstance(value1, _CONTAINER_TYPES) or isinstance(value2, _CONTAINER_TYPES):
+        # Let DeepDiff memoize the item distances it computes while pairing list items
+        return DeepDiff(value1, value2, ignore_order=True, cache_size=5000, view="tree")
+    return DeepDiff(value1, value2, view="tree")
+
+@functools.lru_cache(maxsize=4096)
+def dotted_segment_diffs(old_value, new_value):
+    """Return the differing "old => new" segments of two dotted strings"""
+    # Most values have no dots at all, so there is nothing to split
+    if "." not in old_value and "." not in new_value:
+        return (f"{old_value} => {new_value}",) if old_value != new_value else ()
+    return tuple(
+        f"{o} => {n}"
+        for o, n in zip(old_value.split("."), new_value.split("."))
+        if o != n
+    )
+
+# DeepDiff path noise stripped from report keys: the "root" prefix and quotes
+_PATH_NOISE_RE = re.compile(r"root\.|root(?=\[)|'")
+
 # Extract diff
 def extract_diff(diff, value1, value2, key_path):
     def format_key(path):
-        return (
-            path.replace("root.", "")
-            .replace("root[", "[")
-            .replace("]", "]")
-            .replace("'", "")
-        )
+        return _PATH_NOISE_RE.sub("", path)
 
     def handle_nested_diffs(old_value, new_value, base_key=""):
         diffs = []
@@ -214,37 +414,162 @@ def extract_diff(diff, value1, value2, key_path):
                     diffs.append(f"{nested_key}: {old_value[i]} was removed")
         else:
             if isinstance(old_value, str) and isinstance(new_value, str):
-                old_parts = old_value.split(".")
-                new_parts = new_value.split(".")
-                differences = [
-                    f"{o} => {n}" for o, n in zip(old_parts, new_parts) if o != n
-                ]
+                differences = dotted_segment_diffs(old_value, new_value)
                 diffs.extend([f"{base_key}: {diff}" for diff in differences])
             else:
                 diffs.append(f"{base_key}: {old_value} => {new_value}")
         return diffs
 
-    if "values_changed" in diff:
-        changes = diff["values_changed"]
+    def changes_by_path(change_type):
+        # Key the tree nodes by path the way the text view does, so repeated
+        # paths collapse and lines keep the text view's order
+        return {level.path(force="fake"): level for level in diff.get(change_type, ())}
+
+    # Read changes straight off the tree nodes; only whole list items that
+    # DeepDiff could not pair up still need handle_nested_diffs to descend.
+    # The tree view keeps empty report buckets, so test them for content
+    values_changed = changes_by_path("values_changed")
+    if values_changed:
         diffs = []
-        for path, change in changes.items():
-            old_value = change["old_value"]
-            new_value = change["new_value"]
-            key = format_key(path)
-            diffs.extend(handle_nested_diffs(old_value, new_value, key))
+        for path, level in values_changed.items():
+            diffs.extend(handle_nested_diffs(level.t1, level.t2, format_key(path)))
         return "\n".join(diffs)
-    elif "iterable_item_removed" in diff or "iterable_item_added" in diff:
-        diffs = []
-        for change_type in ["iterable_item_removed", "iterable_item_added"]:
-            if change_type in diff:
-                for path, change in diff[change_type].items():
-                    key = format_key(path)
-                    diffs.append(
-                        f"{key}: {change} was {change_type.replace('iterable_item_', '')}"
-                    )
+    removed = changes_by_path("iterable_item_removed")
+    added = changes_by_path("iterable_item_added")
+    if removed or added:
+        diffs = [f"{format_key(path)}: {level.t1} was removed" for path, level in removed.items()]
+        diffs.extend(f"{format_key(path)}: {level.t2} was added" for path, level in added.items())
         return "\n".join(diffs)
+    return f"{value1} => {value2}"
+
+def _dumps(value):
+    """Serialize a value as 2-space indented JSON, preferring orjson when available"""
+    # orjson writes NaN/Infinity as null and formats floats differently
+    # (1e16 vs 1e+16), so values holding floats keep the json rendering
+    if orjson is not None and not _holds_type(value, float):
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. non-str keys, huge ints) go through json
+            pass
+    return json.dumps(value, indent=2)
+
+# Marker for a key missing from one side; never equal to a parsed value
+_MISSING = object()
+
+# Serialized form of the "undefined" placeholder shown for missing keys
+_UNDEFINED_JSON = _dumps("undefined")
+
+def dump_value(value):
+    """Serialize a value for display, reusing the constant for missing keys"""
+    if value is _MISSING:
+        return _UNDEFINED_JSON
+    value_type = type(value)
+    # Plain ASCII strings and ints serialize to themselves; skip the encoder
+    if value_type is str:
+        if value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+            return f'"{value}"'
+    elif value_type is int:
+        return str(value)
+    return _dumps(value)
+
+# Formatted diffs keyed by the serialized value pair, evicted least recently used
+_EXACT_DIFF_CACHE = OrderedDict()
+_EXACT_DIFF_CACHE_SIZE = 4096
+
+def _cached_exact_diff(value1, value2, value1_json, value2_json):
+    """Diff two values; recurring pairs across sections and files reuse the cached result"""
+    cache_key = (value1_json, value2_json)
+    try:
+        exact_diff = _EXACT_DIFF_CACHE[cache_key]
+    except KeyError:
+        # Diff the live objects on a miss rather than re-parsing their JSON
+        diff = diff_values(value1, value2)
+        exact_diff = extract_diff(diff, value1, value2, "") if diff else None
+        _EXACT_DIFF_CACHE[cache_key] = exact_diff
+        if len(_EXACT_DIFF_CACHE) > _EXACT_DIFF_CACHE_SIZE:
+            _EXACT_DIFF_CACHE.popitem(last=False)
     else:
-        return f"{value1} => {value2}"
+        _EXACT_DIFF_CACHE.move_to_end(cache_key)
+    return exact_diff
+
+def get_property_diff(value1, value2, value1_json=None, value2_json=None):
+    """Return the formatted diff between two .properties string values, or None when equal"""
+    # Properties values are plain strings, so DeepDiff would only ever report a
+    # single root change; format it directly the same way extract_diff does
+    if value1 == value2:
+        return None
+    return "\n".join(f"root: {diff}" for diff in dotted_segment_diffs(value1, value2))
+
+def get_exact_diff(value1, value2, value1_json, value2_json):
+    """Return the formatted diff between two values, or None when they are equal"""
+    if strictly_equal(value1, value2):
+        return None
+    # Reordered lists are equal under ignore_order; skip DeepHash entirely
+    if same_items_ignoring_order(value1, value2):
+        return None
+    return _cached_exact_diff(value1, value2, value1_json, value2_json)
+
+# One rendered comparison row; a tuple keeps large result lists compact
+ComparisonRow = namedtuple(
+    "ComparisonRow", "key value1 value2 exact_diff row_class status"
+)
+
+# Function to build comparison rows shared by .tfvars, JSON and .properties data
+def _compare_data(data1, data2, all_keys, env1, env2, diff_fn):
+    """Compare data1 and data2 over all_keys, using diff_fn to diff values present in both"""
+    comparison_results = []
+    # Plain local counters; the summary dict is assembled once after the loop
+    equal = undefined = red = blue = 0
+    env_indicators = get_environment_indicators(env1, env2)
+    env1_upper, env2_upper = env1.upper(), env2.upper()
+
+    for key in all_keys:
+        value1 = data1.get(key, _MISSING)
+        value2 = data2.get(key, _MISSING)
+        key_path = key
+        value1_json = dump_value(value1)
+        value2_json = value1_json if value1 is value2 else dump_value(value2)
+
+        if value1 is not _MISSING and value2 is not _MISSING:
+            exact_diff = diff_fn(value1, value2, value1_json, value2_json)
+            if exact_diff is not None:
+                row_class = (
+                    "blue"
+                    if is_environment_specific(key_path, env_indicators, value1, value2)
+                    else "red"
+                )
+                status = (
+                    "Values differ as expected for environments"
+                    if row_class == "blue"
+                    else "Unexpected difference, please review"
+                )
+                if row_class == "blue":
+                    blue += 1
+                else:
+                    red += 1
+            else:
+                exact_diff = ""
+                row_class = "equal"
+                status = "Equal"
+                equal += 1
+        elif value1 is _MISSING:
+            exact_diff = f"{key} is not defined in {env1_upper}"
+            row_class = "yellow"
+            status = f"Not defined in {env1_upper}"
+            undefined += 1
+        else:
+            exact_diff = f"{key} is not defined in {env2_upper}"
+            row_class = "yellow"
+            status = f"Not defined in {env2_upper}"
+            undefined += 1
+
+        comparison_results.append(
+            ComparisonRow(key, value1_json, value2_json, exact_diff, row_class, status)
+        )
+
+    summary = {"equal": equal, "undefined": undefined, "red": red, "blue": blue}
+    return comparison_results, summary
 
 # Function to compare .tfvars data
 def compare_tfvars_data(data1, data2, env1, env2):
@@ -253,57 +578,10 @@ def compare_tfvars_data(data1, data2, env1, env2):
         data1_filtered = {k: v for k, v in data1.items() if k != 'compareIdentifier'}
         data2_filtered = {k: v for k, v in data2.items() if k != 'compareIdentifier'}
 
-        all_keys = set(data1_filtered.keys()).union(set(data2_filtered.keys()))
-        all_keys = sorted(all_keys, key=str.lower)
-        comparison_results = []
-        summary = {"equal": 0, "undefined": 0, "red": 0, "blue": 0}
-
-        for key in all_keys:
-            value1 = data1_filtered.get(key, "undefined")
-            value2 = data2_filtered.get(key, "undefined")
-            key_path = key
-
-            if value1 != "undefined" and value2 != "undefined":
-                diff = DeepDiff(value1, value2, ignore_order=True)
-                if diff:
-                    exact_diff = extract_diff(diff, value1, value2, key_path)
-                    row_class = (
-                        "blue"
-                        if is_environment_specific(key_path, env1, env2, value1, value2)
-                        else "red"
-                    )
-                    status = (
-                        "Values differ as expected for environments"
-                        if row_class == "blue"
-                        else "Unexpected difference, please review"
-                    )
-                    summary["blue" if row_class == "blue" else "red"] += 1
-                else:
-                    exact_diff = ""
-                    row_class = "equal"
-                    status = "Equal"
-                    summary["equal"] += 1
-            elif value1 == "undefined":
-                exact_diff = f"{key} is not defined in {env1.upper()}"
-                row_class = "yellow"
-                status = f"Not defined in {env1.upper()}"
-                summary["undefined"] += 1
-            else:
-                exact_diff = f"{key} is not defined in {env2.upper()}"
-                row_class = "yellow"
-                status = f"Not defined in {env2.upper()}"
-                summary["undefined"] += 1
-            comparison_results.append(
-                {
-                    "key": key,
-                    "value1": json.dumps(value1, indent=2),
-                    "value2": json.dumps(value2, indent=2),
-                    "exact_diff": exact_diff,
-                    "row_class": row_class,
-                    "status": status,
-                }
-            )
-        return comparison_results, summary
+        all_keys = sorted(data1_filtered.keys() | data2_filtered.keys(), key=str.lower)
+        return _compare_data(
+            data1_filtered, data2_filtered, all_keys, env1, env2, get_exact_diff
+        )
     except Exception as e:
         logging.error(f"Error during comparison: {str(e)}")
         sys.exit(1)
@@ -311,191 +589,107 @@ def compare_tfvars_data(data1, data2, env1, env2):
 # Function to compare .properties files
 def compare_properties_data(data1, data2, env1, env2):
     try:
-        all_keys = set(data1.keys()).union(set(data2.keys()))
-        all_keys = sorted(all_keys, key=str.lower)
-        comparison_results = []
-        summary = {"equal": 0, "undefined": 0, "red": 0, "blue": 0}
-
-        for key in all_keys:
-            value1 = data1.get(key, "undefined")
-            value2 = data2.get(key, "undefined")
-            key_path = key
-
-            if value1 != "undefined" and value2 != "undefined":
-                diff = DeepDiff(value1, value2, ignore_order=True)
-                if diff:
-                    exact_diff = extract_diff(diff, value1, value2, key_path)
-                    row_class = (
-                        "blue"
-                        if is_environment_specific(key_path, env1, env2, value1, value2)
-                        else "red"
-                    )
-                    status = (
-                        "Values differ as expected for environments"
-                        if row_class == "blue"
-                        else "Unexpected difference, please review"
-                    )
-                    summary["blue" if row_class == "blue" else "red"] += 1
-                else:
-                    exact_diff = ""
-                    row_class = "equal"
-                    status = "Equal"
-                    summary["equal"] += 1
-            elif value1 == "undefined":
-                exact_diff = f"{key} is not defined in {env1.upper()}"
-                row_class = "yellow"
-                status = f"Not defined in {env1.upper()}"
-                summary["undefined"] += 1
-            else:
-                exact_diff = f"{key} is not defined in {env2.upper()}"
-                row_class = "yellow"
-                status = f"Not defined in {env2.upper()}"
-                summary["undefined"] += 1
-
-            comparison_results.append(
-                {
-                    "key": key,
-                    "value1": json.dumps(value1, indent=2),
-                    "value2": json.dumps(value2, indent=2),
-                    "exact_diff": exact_diff,
-                    "row_class": row_class,
-                    "status": status,
-                }
-            )
-
-        return comparison_results, summary
+        # parse_properties returns keys already sorted, so a linear merge is enough
+        all_keys = heapq.merge(
+            data1,
+            (k for k in data2 if k not in data1),
+            key=str.lower,
+        )
+        return _compare_data(data1, data2, all_keys, env1, env2, get_property_diff)
     except Exception as e:
         logging.error(f"Error during comparison: {str(e)}")
         sys.exit(1)
 
-# Function to write summary to HTML
-def write_summary_to_html(output_file, env1, env2, branch_name, commit_id, commit_message):
-    try:
-        with open(output_file, "r") as output:
-            template = output.read()
+def compare_properties_file(properties_file, env1_path, env2_path, env1, env2):
+    """Parse and compare one .properties file present in both envs"""
+    data1 = parse_properties(os.path.join(env1_path, properties_file))
+    data2 = parse_properties(os.path.join(env2_path, properties_file))
+    return compare_properties_data(data1, data2, env1, env2)
 
-        summary_html = f"""
+# Function to build the summary HTML
+def build_summary_html(env1, env2, branch_name, commit_id, commit_message):
+    """Return the summary block for the {summary} placeholder of the template"""
+    return f"""
         <h3>Summary</h3>
         <p><strong>Branch:</strong> {escape_html(branch_name)}</p>
         <p><strong>Latest Commit:</strong> {escape_html(commit_id)} - {escape_html(commit_message)}</p>
         <p><strong>Comparing ENVs:</strong> {env1.upper()} & {env2.upper()}</p>
         """
-        html_content = template.replace("{summary}", summary_html)
 
-        with open(output_file, "w") as file:
-            file.write(html_content)
+# Markup wrapped around the accordion items in the {body} slot of the report
+_PROPERTIES_BODY_OPEN = """
+                <div class="accordion" id="accordion-properties">
+                    """
+_TFVARS_BODY_OPEN = """
+                <div class="accordion" id="accordion-tfvars">
+                    """
+_ACCORDION_BODY_CLOSE = """
+                </div>
+            """
 
-        logging.info(f"Summary successfully written to {output_file}")
-    except Exception as e:
-        logging.error(f"Error writing to HTML file {output_file}: {str(e)}")
-        sys.exit(1)
+@functools.lru_cache(maxsize=8)
+def _load_template(template_path, mtime_ns):
+    """Read and split a template once per path; the mtime argument invalidates it on edits"""
+    with open(template_path, "r", encoding="utf-8") as template_file:
+        template = template_file.read()
+    # Split on {body} once so the report body is never copied into a combined string
+    prefix, _, suffix = template.partition("{body}")
+    return prefix, suffix
+
+def write_report(template_path, output_file, placeholders, body_parts):
+    """Fill the template placeholders and stream body_parts into the {body} slot of output_file"""
+    prefix, suffix = _load_template(template_path, os.stat(template_path).st_mtime_ns)
+    for placeholder, html in placeholders.items():
+        prefix = prefix.replace(placeholder, html)
+        suffix = suffix.replace(placeholder, html)
+    # Write next to the target and rename so a failed run never leaves a truncated report
+    tmp_path = f"{output_file}.tmp"
+    try:
+        # A large buffer turns the many small fragment writes into a few big ones
+        with open(tmp_path, "w", buffering=1 << 20, encoding="utf-8") as file:
+            file.write(prefix)
+            file.writelines(body_parts)
+            file.write(suffix)
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 def generate_tabs(sections):
     """Generate HTML for tab navigation"""
-    tabs_html = ""
+    tab_parts = []
     for i, section in enumerate(sections):
         active = 'active' if i == 0 else ''
-        tabs_html += f"""
+        section_id = section.lower()
+        tab_parts.append(f"""
         <li class="nav-item" role="presentation">
-            <button class="nav-link {active}" id="tab-{section.lower()}" 
-                    data-bs-toggle="tab" data-bs-target="#content-{section.lower()}" 
+            <button class="nav-link {active}" id="tab-{section_id}" 
+                    data-bs-toggle="tab" data-bs-target="#content-{section_id}" 
                     type="button" role="tab">
                 {section}
             </button>
         </li>
-        """
-    return tabs_html
-
-def write_comparison_to_html(
-    section_name, subsection_name, comparison_results, summary, 
-    template_path, output_file, env1, env2, missing_in_env=None, 
-    file1_path="", file2_path=""):
-    try:
-        if missing_in_env:
-            content = f"""
-            <div class="alert alert-warning">
-                File is missing in {missing_in_env.upper()}
-            </div>
-            """
-        else:
-            # Generate comparison table
-            rows = ""
-            for comparison in comparison_results:
-                key = comparison["key"]
-                value1 = escape_html(comparison["value1"])
-                value2 = escape_html(comparison["value2"])
-                exact_diff = escape_html(comparison["exact_diff"]) if comparison["exact_diff"] else ""
-                row_class = comparison["row_class"]
-                status = comparison["status"]
-
-                rows += f"""
-                <tr class="{row_class}">
-                    <td>{escape_html(key)}</td>
-                    <td><pre>{value1}</pre></td>
-                    <td><pre>{value2}</pre></td>
-                    <td><pre>{exact_diff}</pre></td>
-                    <td class="status">{status}</td>
-                </tr>
-                """
-
-            # Generate statistics
-            stats = f"""
-            <div class="comparison-stats">
-                <div class="stat-item"><span class="stat-dot equal-dot"></span> Equal: {summary['equal']}</div>
-                <div class="stat-item"><span class="stat-dot undefined-dot"></span> Undefined: {summary['undefined']}</div>
-                <div class="stat-item"><span class="stat-dot red-dot"></span> Check Required: {summary['red']}</div>
-                <div class="stat-item"><span class="stat-dot blue-dot"></span> Environment Specific: {summary['blue']}</div>
-            </div>
-            """
-
-            content = f"""
-            {stats}
-            <table class="table table-bordered">
-                <thead>
-                    <tr>
-                        <th>Key</th>
-                        <th>{env1.upper()}</th>
-                        <th>{env2.upper()}</th>
-                        <th>Comparison</th>
-                        <th>Status</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {rows}
-                </tbody>
-            </table>
-            """
+        """)
+    return "".join(tab_parts)
 
-        accordion_item = f"""
-        <div class="accordion-item">
-            <h2 class="accordion-header" id="heading-{section_name.lower()}-{subsection_name.lower()}">
-                <button class="accordion-button" type="button" data-bs-toggle="collapse" 
-                        data-bs-target="#collapse-{section_name.lower()}-{subsection_name.lower()}">
-                    {subsection_name}
-                </button>
-            </h2>
-            <div id="collapse-{section_name.lower()}-{subsection_name.lower()}" 
-                 class="accordion-collapse collapse" 
-                 data-bs-parent="#accordion-{section_name.lower()}">
-                <div class="accordion-body">
-                    {content}
-                </div>
-            </div>
-        </div>
-        """
-
-        with open("temp.html", "a") as file:
-            file.write(accordion_item)
-
-    except Exception as e:
-        logging.error(f"Error writing to HTML file: {str(e)}")
-        sys.exit(1)
-        
-        
 def is_nested_dict(data):
     """Check if the dictionary has nested dictionaries as values"""
     return bool(data) and all(isinstance(v, dict) for v in data.values())
 
+# Accordion table row markup; filled with (row_class, key, value1, value2, exact_diff, status)
+_ACCORDION_ROW_FMT = """
+        <tr class="%s">
+            <td>%s</td>
+            <td><pre>%s</pre></td>
+            <td><pre>%s</pre></td>
+            <td><pre>%s</pre></td>
+            <td class="status">%s</td>
+        </tr>
+        """
+
 def generate_accordion_item(section, subsection, comparison_results, summary, env1, env2, missing_in_env=None, compare_identifier1=None, compare_identifier2=None):
     """Generate HTML for an accordion item"""
     # Sanitize the IDs
@@ -528,24 +722,19 @@ def generate_accordion_item(section, subsection, comparison_results, summary, en
         """
 
     # Generate table rows
-    rows = ""
+    row_parts = []
     for comparison in comparison_results:
-        key = comparison["key"]
-        value1 = escape_html(comparison["value1"])
-        value2 = escape_html(comparison["value2"])
-        exact_diff = escape_html(comparison["exact_diff"]) if comparison["exact_diff"] else ""
-        row_class = comparison["row_class"]
-        status = comparison["status"]
-
-        rows += f"""
-        <tr class="{row_class}">
-            <td>{escape_html(key)}</td>
-            <td><pre>{value1}</pre></td>
-            <td><pre>{value2}</pre></td>
-            <td><pre>{exact_diff}</pre></td>
-            <td class="status">{status}</td>
-        </tr>
-        """
+        key = comparison.key
+        value1 = escape_html(comparison.value1)
+        value2 = escape_html(comparison.value2)
+        exact_diff = escape_html(comparison.exact_diff) if comparison.exact_diff else ""
+        row_class = comparison.row_class
+        status = comparison.status
+
+        row_parts.append(_ACCORDION_ROW_FMT % (
+            row_class, escape_html(key), value1, value2, exact_diff, status
+        ))
+    rows = "".join(row_parts)
 
     # Update the comparison stats section with proper data attributes
     stats_html = f"""
@@ -633,23 +822,16 @@ def main(
             sections = list(data1.keys())
             tabs_html = generate_tabs(sections)
 
-            # Initialize the output file with the template
-            with open(template_path, "r") as template_file:
-                template = template_file.read()
-                template = template.replace("{tabs}", tabs_html)
-                template = template.replace("{summary}", summary_html)
-                with open(output_file, "w") as file:
-                    file.write(template)
-
-            # Create a string to store all tab content
-            all_tab_content = ""
+            # Collect all tab content in memory; the report is written once at the end
+            body_parts = []
 
             # Process each section
             for section in sections:
-                section_html = f"""
-                <div class="tab-pane fade" id="content-{section.lower()}" role="tabpanel">
-                    <div class="accordion" id="accordion-{section.lower()}" data-bs-parent="#comparisonTabsContent">
-                """
+                section_id = section.lower()
+                body_parts.append(f"""
+                <div class="tab-pane fade" id="content-{section_id}" role="tabpanel">
+                    <div class="accordion" id="accordion-{section_id}" data-bs-parent="#comparisonTabsContent">
+                """)
 
                 # Process the section content
                 if is_nested_dict(data1[section]):
@@ -677,7 +859,7 @@ def main(
                             compare_identifier1=compare_identifier1,
                             compare_identifier2=compare_identifier2
                         )
-                        section_html += accordion_item
+                        body_parts.append(accordion_item)
                 else:
                     # Handle flat structure (like parameterStore)
                     # Get compareIdentifier if it exists
@@ -702,57 +884,50 @@ def main(
                         compare_identifier1=compare_identifier1,
                         compare_identifier2=compare_identifier2
                     )
-                    section_html += accordion_item
+                    body_parts.append(accordion_item)
 
                 # Close section divs
-                section_html += "</div></div>"
-                all_tab_content += section_html
+                body_parts.append("</div></div>")
 
-            # Replace the {body} placeholder with all tab content
-            with open(output_file, "r") as file:
-                content = file.read()
-            
-            content = content.replace("{body}", all_tab_content)
-            
-            with open(output_file, "w") as file:
-                file.write(content)
+            write_report(
+                template_path,
+                output_file,
+                {"{tabs}": tabs_html, "{summary}": summary_html},
+                body_parts,
+            )
 
         elif isConfigCompare:
             # Compare .properties files
             env1_path = os.path.join(config_directory_path, env1)
             env2_path = os.path.join(config_directory_path, env2)
 
-            if not os.path.exists(env1_path) or not os.path.exists(env2_path):
+            # Dynamically find all .properties files
+            try:
+                env1_files = list_properties_files(env1_path)
+                env2_files = list_properties_files(env2_path)
+            except (FileNotFoundError, NotADirectoryError):
                 logging.error(f"One or both environment directories not found: {env1_path}, {env2_path}")
                 sys.exit(1)
 
             # Generate summary
-            summary_html = f"""
-            <h3>Summary</h3>
-            <p><strong>Branch:</strong> {escape_html(branch_name)}</p>
-            <p><strong>Latest Commit:</strong> {escape_html(commit_id)} - {escape_html(commit_message)}</p>
-            <p><strong>Comparing ENVs:</strong> {env1.upper()} & {env2.upper()}</p>
-            """
+            summary_html = build_summary_html(env1, env2, branch_name, commit_id, commit_message)
 
-            # Initialize the output file with the template
-            with open(template_path, "r") as template_file:
-                template = template_file.read()
-                template = template.replace("{summary}", summary_html)
-                with open(output_file, "w") as file:
-                    file.write(template)
+            all_files = sorted(env1_files | env2_files)
 
-            # Dynamically find all .properties files
-            env1_files = [f for f in os.listdir(env1_path) if f.endswith(".properties")]
-            env2_files = [f for f in os.listdir(env2_path) if f.endswith(".properties")]
-            all_files = set(env1_files).union(set(env2_files))
+            # Parse and compare the files present in both envs. These are small
+            # files, so worker processes cost more to start than they save
+            common_files = sorted(env1_files & env2_files)
+            compared_files = {
+                properties_file: compare_properties_file(
+                    properties_file, env1_path, env2_path, env1, env2
+                )
+                for properties_file in common_files
+            }
 
-            all_content = ""
+            body_parts = [_PROPERTIES_BODY_OPEN]
             for properties_file in all_files:
-                file1_path = os.path.join(env1_path, properties_file)
-                file2_path = os.path.join(env2_path, properties_file)
-
                 if properties_file in env1_files and properties_file not in env2_files:
-                    all_content += generate_accordion_item(
+                    body_parts.append(generate_accordion_item(
                         "properties",
                         properties_file,
                         None,
@@ -760,9 +935,9 @@ def main(
                         env1,
                         env2,
                         missing_in_env=env2
-                    )
+                    ))
                 elif properties_file in env2_files and properties_file not in env1_files:
-                    all_content += generate_accordion_item(
+                    body_parts.append(generate_accordion_item(
                         "properties",
                         properties_file,
                         None,
@@ -770,32 +945,22 @@ def main(
                         env1,
                         env2,
                         missing_in_env=env1
-                    )
+                    ))
                 else:
-                    data1 = parse_properties(file1_path)
-                    data2 = parse_properties(file2_path)
-                    comparison_results, summary = compare_properties_data(data1, data2, env1, env2)
-                    all_content += generate_accordion_item(
+                    comparison_results, summary = compared_files[properties_file]
+                    body_parts.append(generate_accordion_item(
                         "properties",
                         properties_file,
                         comparison_results,
                         summary,
                         env1,
                         env2
-                    )
+                    ))
+            body_parts.append(_ACCORDION_BODY_CLOSE)
 
-            # Replace the {body} placeholder with all content
-            with open(output_file, "r") as file:
-                content = file.read()
-            
-            content = content.replace("{body}", f"""
-                <div class="accordion" id="accordion-properties">
-                    {all_content}
-                </div>
-            """)
-            
-            with open(output_file, "w") as file:
-                file.write(content)
+            write_report(
+                template_path, output_file, {"{summary}": summary_html}, body_parts
+            )
 
         else:
             # Compare .tfvars files
@@ -822,14 +987,6 @@ def main(
             <p><strong>Comparing ENVs:</strong> {env1.upper()} & {env2.upper()}</p>
             """
 
-            # Initialize the output file with the template
-            with open(template_path, "r") as template_file:
-                template = template_file.read()
-                template = template.replace("{summary}", summary_html)
-                template = template.replace("{tabs}", '')  # No tabs for single file comparison
-                with open(output_file, "w") as file:
-                    file.write(template)
-
             accordion_content = generate_accordion_item(
                 "tfvars",
                 "Configuration",
@@ -839,46 +996,95 @@ def main(
                 env2
             )
 
-            # Replace the {body} placeholder with accordion content
-            with open(output_file, "r") as file:
-                content = file.read()
-            
-            content = content.replace("{body}", f"""
-                <div class="accordion" id="accordion-tfvars">
-                    {accordion_content}
-                </div>
-            """)
-            
-            with open(output_file, "w") as file:
-                file.write(content)
+            write_report(
+                template_path,
+                output_file,
+                # No tabs for single file comparison
+                {"{summary}": summary_html, "{tabs}": ""},
+                (_TFVARS_BODY_OPEN, accordion_content, _ACCORDION_BODY_CLOSE),
+            )
 
     except Exception as e:
-        logging.error(f"An error occurred: {str(e)}")
+        logging.exception("An error occurred: %s", e)
         sys.exit(1)
         
         
-if __name__ == "__main__":
-    if len(sys.argv) < 10:
-        logging.error(
-            "Usage: python compare_vars.py <env1> <env2> <template_path> <output_file> <config_directory_path> <branch_name> <commit_id> <commit_message> <isConfigCompare> <isJsonCompare> <json_file1_path> <json_file2_path>"
+# Positional command-line arguments, in order
+def parse_flag(value):
+    """Interpret a "true"/"false" command-line flag, case-insensitively"""
+    return value.lower() == "true"
+
+def build_arg_parser():
+    """Return the parser for the positional command-line arguments of main()"""
+    parser = argparse.ArgumentParser(
+        prog="compare_vars.py",
+        description="Compare .tfvars, .properties or AWS config JSON files between two environments",
+    )
+    parser.add_argument("env1")
+    parser.add_argument("env2")
+    parser.add_argument("template_path")
+    parser.add_argument("output_file")
+    parser.add_argument("config_directory_path")
+    parser.add_argument("branch_name")
+    parser.add_argument("commit_id")
+    parser.add_argument("commit_message")
+    parser.add_argument("isConfigCompare", type=parse_flag)
+    # The three JSON comparison arguments are given together or not at all; see parse_args
+    parser.add_argument("isJsonCompare", type=parse_flag, nargs="?", default=False)
+    parser.add_argument("json_file1_path", nargs="?", default="")
+    parser.add_argument("json_file2_path", nargs="?", default="")
+    return parser
+
+# Argument counts after the script name: without and with the JSON comparison arguments
+_ACCEPTED_ARG_COUNTS = (9, 12)
+
+def parse_args(argv):
+    """Convert sys.argv into the positional arguments of main()"""
+    parser = build_arg_parser()
+    # Only the full form or the form without the JSON comparison arguments is accepted,
+    # so a forgotten argument is a usage error instead of a silently padded default
+    if len(argv) - 1 not in _ACCEPTED_ARG_COUNTS:
+        parser.error(
+            f"expected {' or '.join(map(str, _ACCEPTED_ARG_COUNTS))} arguments, got {len(argv) - 1}"
         )
-        sys.exit(1)
+    # "--" keeps values such as a commit message starting with "-" from being read as options
+    args = parser.parse_args(["--", *argv[1:]])
+    return (
+        args.env1,
+        args.env2,
+        args.template_path,
+        args.output_file,
+        args.config_directory_path,
+        args.branch_name,
+        args.commit_id,
+        args.commit_message,
+        args.isConfigCompare,
+        args.isJsonCompare,
+        args.json_file1_path,
+        args.json_file2_path,
+    )
 
-    env1 = sys.argv[1]
-    env2 = sys.argv[2]
-    template_path = sys.argv[3]
-    output_file = sys.argv[4]
-    config_directory_path = sys.argv[5]
-    branch_name = sys.argv[6]
-    commit_id = sys.argv[7]
-    commit_message = sys.argv[8]
-    isConfigCompare = sys.argv[9].lower() == "true"
-    isJsonCompare = sys.argv[10].lower() == "true"
-    json_file1_path = sys.argv[11]
-    json_file2_path = sys.argv[12]
-
-    logging.info(
-        f"env1: {env1}, env2: {env2}, config_directory_path: {config_directory_path}, template_path: {template_path}, output_file: {output_file}, branch: {branch_name}, commit_id: {commit_id}, commit_message: {commit_message}, isConfigCompare: {isConfigCompare}, isJsonCompare: {isJsonCompare}, json_file1_path: {json_file1_path}, json_file2_path: {json_file2_path}"
+if __name__ == "__main__":
+    (
+        env1,
+        env2,
+        template_path,
+        output_file,
+        config_directory_path,
+        branch_name,
+        commit_id,
+        commit_message,
+        isConfigCompare,
+        isJsonCompare,
+        json_file1_path,
+        json_file2_path,
+    ) = parse_args(sys.argv)
+
+    # %-style arguments are only formatted if the record is actually emitted
+    logging.debug(
+        "env1: %s, env2: %s, config_directory_path: %s, template_path: %s, output_file: %s, branch: %s, commit_id: %s, commit_message: %s, isConfigCompare: %s, isJsonCompare: %s, json_file1_path: %s, json_file2_path: %s",
+        env1, env2, config_directory_path, template_path, output_file, branch_name,
+        commit_id, commit_message, isConfigCompare, isJsonCompare, json_file1_path, json_file2_path,
     )
 
     main(
@@ -895,5 +1101,3 @@ if __name__ == "__main__":
         json_file1_path,
         json_file2_path,
     )
-
-
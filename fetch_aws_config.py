@@ -1,8 +1,66 @@
 import boto3
+import functools
+import hashlib
 import json
+import os
+import pickle
 import sys
+import tempfile
+import threading
+import time
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# orjson is optional: it parses the env config faster, but the stdlib decoder
+# is used whenever it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-environment fetch settings, read from the working directory
+ENV_CONFIG_FILE = 'aws_env_config.json'
+
+# Upper bound on concurrent AWS API calls issued by a single fan-out
+MAX_WORKERS = int(os.environ.get('AWS_FETCH_CONCURRENCY', '16'))
+
+# DescribeServices accepts at most 10 services per request
+ECS_DESCRIBE_BATCH_SIZE = 10
+
+# DescribeClusters accepts at most 100 clusters per request
+ECS_DESCRIBE_CLUSTERS_BATCH_SIZE = 100
+
+# DescribeLoadBalancers accepts at most 20 names or ARNs per request
+ELB_DESCRIBE_BATCH_SIZE = 20
+
+# Upper bound on values sent in a single DescribeDBInstances db-instance-id filter
+RDS_FILTER_BATCH_SIZE = 20
+
+# Shared client config: a pooled keep-alive connection for every worker thread and adaptive retries for throttling
+BOTO_CONFIG = Config(
+    max_pool_connections=max(32, MAX_WORKERS),
+    tcp_keepalive=True,
+    retries={'max_attempts': 10, 'mode': 'adaptive'}
+)
+
+# Seconds a read-only AWS response cached on disk stays reusable by later runs; 0 (the default) disables the cache
+AWS_CACHE_TTL = int(os.environ.get('AWS_FETCH_CACHE_TTL', '0'))
+AWS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'env-compare', 'aws')
+
+# Only operations that never change anything are served from the cache
+CACHEABLE_OPERATION_PREFIXES = ('Describe', 'Get', 'List')
+
+# One session for the whole run so credentials are resolved once and clients share it
+_SESSION = boto3.session.Session()
+# Sessions are not thread-safe, so clients are created from it one at a time
+_SESSION_LOCK = threading.Lock()
+_PRINT_LOCK = threading.Lock()
+# One bounded pool shared by every fan-out, nested ones included, so a run never has more
+# than MAX_WORKERS worker threads; its threads are started on demand
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """
@@ -14,37 +72,161 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def find_team_cluster(team_tag_key='ApplicationShortName', team_tag_value=''):
+@functools.lru_cache(maxsize=None)
+def get_client(service_name):
     """
-    Finds all ECS cluster ARNs for a given ApplicationShortName tag value.
+    Returns the shared us-east-1 client for service_name, creating it on first use.
+    Clients are thread-safe, so the same instance is reused by the worker pools.
     """
-    ecs_client = boto3.client(service_name='ecs', region_name='us-east-1')
-    matching_clusters = []
+    with _SESSION_LOCK:
+        client = _SESSION.client(service_name, region_name='us-east-1', config=BOTO_CONFIG)
+    if AWS_CACHE_TTL > 0:
+        client.meta.events.register('before-call', serve_cached_response)
+        client.meta.events.register('after-call', store_cached_response)
+    return client
+
+
+def serve_cached_response(params, model, context, **kwargs):
+    """
+    before-call handler: returns a fresh enough cached response for a read-only call, which skips the request.
+    """
+    if not model.name.startswith(CACHEABLE_OPERATION_PREFIXES):
+        return None
+
+    # The credentials' access key keeps responses from different accounts apart; the URL carries the region
+    credentials = _SESSION.get_credentials()
+    cache_key = repr((
+        credentials.access_key if credentials else None,
+        params['url'], params['method'], params['query_string'], params['body']
+    ))
+    cache_path = os.path.join(AWS_CACHE_DIR, f"{model.name}-{hashlib.sha1(cache_key.encode()).hexdigest()}.pkl")
+    context['response_cache_path'] = cache_path
 
     try:
-        # List all clusters with pagination
-        clusters = []
-        paginator = ecs_client.get_paginator('list_clusters')
-        for page in paginator.paginate():
-            clusters.extend(page.get('clusterArns', []))
+        if time.time() - os.path.getmtime(cache_path) > AWS_CACHE_TTL:
+            return None
+        with open(cache_path, 'rb') as cache_file:
+            parsed_response = pickle.load(cache_file)
+    except Exception:
+        # Missing, expired or unreadable entries are fetched from AWS
+        return None
+
+    context['response_cache_hit'] = True
+    return AWSResponse(params['url'], 200, {}, None), parsed_response
+
+
+def store_cached_response(http_response, parsed, context, **kwargs):
+    """
+    after-call handler: caches successful read-only responses for serve_cached_response.
+    """
+    cache_path = context.get('response_cache_path')
+    if cache_path is None or context.get('response_cache_hit') or http_response.status_code >= 300:
+        return
 
-        for cluster_arn in clusters:
-            # Fetch tags for the cluster
-            tags_response = ecs_client.list_tags_for_resource(resourceArn=cluster_arn)
-            tags = tags_response.get('tags', [])
+    try:
+        os.makedirs(AWS_CACHE_DIR, exist_ok=True)
+        # Write to a temp file and rename so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=AWS_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as cache_file:
+            pickle.dump(parsed, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        _log(f"Could not cache AWS response {cache_path}: {e}")
+
+
+def write_output(output_data, output_file):
+    """
+    Writes the collected configurations to output_file as 4-space indented, ASCII-escaped JSON.
+    The document is serialized in memory first so it reaches the file in a single write; the
+    text-mode file keeps the bytes identical to json.dump(output_data, f, indent=4).
+    """
+    serialized = json.dumps(output_data, indent=4, cls=DateTimeEncoder)
+
+    with open(output_file, 'w') as f:
+        f.write(serialized)
+
+
+def _log(*args):
+    """
+    Prints a progress message under a lock: worker threads report progress too, and print writes the text and the newline separately.
+    """
+    with _PRINT_LOCK:
+        print(*args)
+
+
+def map_concurrently(func, items):
+    """
+    Applies func to every item on the shared thread pool and returns the results in input order.
+    The per-resource AWS calls are network bound, so overlapping them hides most of the latency.
+    The caller runs any item no worker has started yet itself, so a worker waiting on a nested
+    fan-out keeps making progress even when every other worker is busy.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    futures = [_EXECUTOR.submit(func, item) for item in items]
+    return [func(item) if future.cancel() else future.result() for item, future in zip(items, futures)]
 
-            # Check if the cluster has the desired team tag
-            for tag in tags:
-                if tag['key'] == team_tag_key and tag['value'] == team_tag_value:
-                    cluster_name = cluster_arn.split('/')[-1]  # Extract cluster name from ARN
-                    matching_clusters.append((cluster_name, cluster_arn))
+
+def find_tagged_resource_arns(resource_type, tag_key, tag_value):
+    """
+    Returns the ARNs of resource_type resources tagged tag_key=tag_value.
+    The Resource Groups Tagging API filters server-side, so untagged resources are never fetched one by one.
+    """
+    tagging_client = get_client('resourcegroupstaggingapi')
+    resource_arns = []
+    paginator = tagging_client.get_paginator('get_resources')
+    for page in paginator.paginate(
+        TagFilters=[{'Key': tag_key, 'Values': [tag_value]}],
+        ResourceTypeFilters=[resource_type]
+    ):
+        resource_arns.extend(mapping['ResourceARN'] for mapping in page.get('ResourceTagMappingList', []))
+    return resource_arns
+
+
+def find_team_cluster(team_tag_key='ApplicationShortName', team_tag_value=''):
+    """
+    Finds all ECS cluster ARNs for a given ApplicationShortName tag value.
+    """
+    try:
+        matching_clusters = [
+            (cluster_arn.split('/')[-1], cluster_arn)  # Extract cluster name from ARN
+            for cluster_arn in find_tagged_resource_arns('ecs:cluster', team_tag_key, team_tag_value)
+        ]
 
         if not matching_clusters:
-            print(f"No ECS clusters found for {team_tag_key} = {team_tag_value}")
+            _log(f"No ECS clusters found for {team_tag_key} = {team_tag_value}")
         return matching_clusters
     except Exception as e:
-        print(f"Error finding ECS clusters: {e}")
-        sys.exit(1)
+        _log(f"Error finding ECS clusters: {e}")
+        return []
+
+
+@functools.lru_cache(maxsize=4096)
+def describe_task_definition(task_definition_arn):
+    """
+    Describes a task definition (with tags) once per ARN; services sharing a revision reuse the response.
+    """
+    return get_client('ecs').describe_task_definition(taskDefinition=task_definition_arn, include=['TAGS'])
+
+
+@functools.lru_cache(maxsize=1)
+def read_env_config_file(mtime_ns):
+    """
+    Parses aws_env_config.json once per modification time, preferring orjson when available.
+    Returns None if the file is empty.
+    """
+    with open(ENV_CONFIG_FILE, 'rb') as f:
+        content = f.read().strip()
+    if not content:
+        return None
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input json accepts (NaN, huge ints); let json decide
+            pass
+    return json.loads(content)
 
 
 def load_env_config(env_index):
@@ -56,13 +238,11 @@ def load_env_config(env_index):
         env_index: Index of environment to load (0, 1, etc.)
     """
     try:
-        with open('aws_env_config.json', 'r') as f:
-            content = f.read().strip()
-            if not content:
-                return None
-            config = json.loads(content)
-            envs = config.get('envs', [])
-            return envs[env_index] if 0 <= env_index < len(envs) else None
+        config = read_env_config_file(os.stat(ENV_CONFIG_FILE).st_mtime_ns)
+        if config is None:
+            return None
+        envs = config.get('envs', [])
+        return envs[env_index] if 0 <= env_index < len(envs) else None
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
@@ -72,60 +252,122 @@ def fetch_ecs_service_config(cluster_configs, use_custom_identifier=False):
     Fetches the configuration of ECS services for specified cluster names.
     Returns services with indexed keys.
     """
-    ecs_client = boto3.client(service_name='ecs', region_name='us-east-1')
+    ecs_client = get_client('ecs')
     all_service_configs = {}
     cluster_index = 0
 
     try:
-        for cluster_config in cluster_configs:
-            service_index = 0
+        # Callers that already know the ARN (tag mode) pass it; exact names are resolved with describe_clusters
+        cluster_arns_by_name = {
+            cluster_config['clusterName']: cluster_config['clusterArn']
+            for cluster_config in cluster_configs
+            if cluster_config.get('clusterArn')
+        }
+        cluster_names = list(dict.fromkeys(
+            cluster_config['clusterName']
+            for cluster_config in cluster_configs
+            if cluster_config['clusterName'] not in cluster_arns_by_name
+        ))
+        for i in range(0, len(cluster_names), ECS_DESCRIBE_CLUSTERS_BATCH_SIZE):
+            described_clusters = ecs_client.describe_clusters(clusters=cluster_names[i:i + ECS_DESCRIBE_CLUSTERS_BATCH_SIZE])
+            for cluster in described_clusters.get('clusters', []):
+                # Deleted clusters stay describable as INACTIVE for a while; treat them as missing
+                if cluster.get('status') != 'INACTIVE':
+                    cluster_arns_by_name[cluster['clusterName']] = cluster['clusterArn']
+
+        # Names that are not exact cluster names fall back to the first listed ARN containing them
+        clusters = []
+        if any(cluster_name not in cluster_arns_by_name for cluster_name in cluster_names):
+            paginator = ecs_client.get_paginator('list_clusters')
+            for page in paginator.paginate():
+                clusters.extend(page.get('clusterArns', []))
+
+        def find_cluster_arn(cluster_name):
+            return cluster_arns_by_name.get(cluster_name) or next((arn for arn in clusters if cluster_name in arn), None)
+
+        def list_cluster_services(cluster_arn):
+            # Fetch services in the cluster with pagination
+            services = []
+            paginator = ecs_client.get_paginator('list_services')
+            for page in paginator.paginate(cluster=cluster_arn):
+                services.extend(page.get('serviceArns', []))
+            return services
+
+        # Resolve every cluster up front so the service listings of all clusters run concurrently
+        cluster_arns = [find_cluster_arn(cluster_config['clusterName']) for cluster_config in cluster_configs]
+        listed_cluster_arns = [
+            cluster_arn
+            for cluster_config, cluster_arn in zip(cluster_configs, cluster_arns)
+            if cluster_arn and not cluster_config.get('serviceNames')
+        ]
+        listed_services = dict(zip(listed_cluster_arns, map_concurrently(list_cluster_services, listed_cluster_arns)))
+
+        def get_task_definition(service_config):
+            # Fetch task definition for the service
+            task_definition_arn = service_config.get('taskDefinition')
+            if not task_definition_arn:
+                return None
+            return describe_task_definition(task_definition_arn)
+
+        def describe_service_batch(batch):
+            """
+            Describes up to ECS_DESCRIBE_BATCH_SIZE services of one cluster in one call, then their task definitions.
+            """
+            cluster_arn, service_batch = batch
+            service_details = ecs_client.describe_services(cluster=cluster_arn, services=service_batch)
+            service_configs = service_details['services']
+            return list(zip(service_configs, map_concurrently(get_task_definition, service_configs)))
+
+        # Report missing clusters and empty clusters in order, keeping the rest for describing
+        cluster_services = []
+        for cluster_config, cluster_arn in zip(cluster_configs, cluster_arns):
             cluster_index += 1
             cluster_name = cluster_config['clusterName']
             service_names = cluster_config.get('serviceNames', [])
-
-            # Get cluster ARN
-            clusters = ecs_client.list_clusters()['clusterArns']
-            cluster_arn = next((arn for arn in clusters if cluster_name in arn), None)
             
             if not cluster_arn:
-                print(f"Cluster not found: {cluster_name}")
+                _log(f"Cluster not found: {cluster_name}")
                 continue
 
-            # Fetch services in the cluster with pagination
-            services = []
-            if service_names:
-                services = service_names
-            else:
-                paginator = ecs_client.get_paginator('list_services')
-                for page in paginator.paginate(cluster=cluster_arn):
-                    services.extend(page.get('serviceArns', []))
+            services = service_names or listed_services[cluster_arn]
 
             if not services:
-                print(f"No services found in cluster '{cluster_name}'")
+                _log(f"No services found in cluster '{cluster_name}'")
                 continue
 
-            for service in services:
-                service_chunk = [service]
-                service_details = ecs_client.describe_services(cluster=cluster_arn, services=service_chunk)
-                
-                for service_config in service_details['services']:
+            service_batches = [
+                (cluster_arn, services[i:i + ECS_DESCRIBE_BATCH_SIZE])
+                for i in range(0, len(services), ECS_DESCRIBE_BATCH_SIZE)
+            ]
+            cluster_services.append((cluster_index, cluster_name, service_batches))
+
+        # Describe the batches of all clusters in one concurrent wave
+        described_batches = iter(map_concurrently(
+            describe_service_batch,
+            [batch for _, _, service_batches in cluster_services for batch in service_batches]
+        ))
+
+        # Index the services in the original cluster and service order
+        for cluster_index, cluster_name, service_batches in cluster_services:
+            service_index = 0
+            for _ in service_batches:
+                for service_config, task_definition_details in next(described_batches):
                     service_index += 1
                     service_config.pop('events', None)
                     service_config.pop('deployments', None)
                     service_name = service_config.get('serviceName')
                     service_key = f"{cluster_name}/{service_name}"
                     
-                    # Fetch task definition for the service
-                    task_definition_arn = service_config.get('taskDefinition')
                     task_definition = {}
-                    if task_definition_arn:
-                        task_definition_details = ecs_client.describe_task_definition(taskDefinition=task_definition_arn, include=['TAGS'])
+                    if task_definition_details:
+                        # Building the entry copies the cached response, so popping from it leaves the cache intact
+                        # for services sharing it; compareIdentifier stays the first key of the entry
                         task_definition_name = task_definition_details['taskDefinition']['family']
-                        container_definitions = task_definition_details['taskDefinition'].pop('containerDefinitions', [])
                         task_definition = {
                             "compareIdentifier": task_definition_name,
                             **task_definition_details['taskDefinition']
                         }
+                        container_definitions = task_definition.pop('containerDefinitions', [])
                     
                     # Store with indexed key and include original service key in config
                     if use_custom_identifier:
@@ -141,9 +383,7 @@ def fetch_ecs_service_config(cluster_configs, use_custom_identifier=False):
                                 **container_definition
                             }
                     else:
-                        all_service_configs[f"{service_key}"] = {
-                            **service_config,
-                        }
+                        all_service_configs[f"{service_key}"] = service_config
                         all_service_configs[f"{service_key}/task_definition"] = task_definition
                         # Add container definitions to all_service_configs
                         for container_definition in container_definitions:
@@ -154,8 +394,8 @@ def fetch_ecs_service_config(cluster_configs, use_custom_identifier=False):
 
         return all_service_configs
     except Exception as e:
-        print(f"Error fetching ECS service configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching ECS service configurations: {e}")
+        return all_service_configs
 
 
 def fetch_rds_config(identifier, use_instance_ids=False):
@@ -163,40 +403,50 @@ def fetch_rds_config(identifier, use_instance_ids=False):
     Fetches RDS configurations either by instance IDs or ApplicationShortName.
     Returns instances with indexed keys or instance names as keys based on mode.
     """
-    rds_client = boto3.client('rds', region_name='us-east-1')
+    rds_client = get_client('rds')
     filtered_instances = {}
     instance_index = 0
 
     try:
-        paginator = rds_client.get_paginator('describe_db_instances')
-        for page in paginator.paginate():
-            for instance in page['DBInstances']:
-                should_include = False
+        if use_instance_ids:
+            instance_filter_values = list(identifier)
+        else:
+            # Using ApplicationShortName - only the tagged instances are described
+            instance_filter_values = find_tagged_resource_arns('rds:db', 'ApplicationShortName', identifier)
+
+        def describe_instances(instance_filter_batch):
+            # The db-instance-id filter accepts instance identifiers as well as ARNs
+            instances = []
+            paginator = rds_client.get_paginator('describe_db_instances')
+            for page in paginator.paginate(Filters=[{'Name': 'db-instance-id', 'Values': instance_filter_batch}]):
+                instances.extend(page['DBInstances'])
+            return instances
+
+        instance_filter_batches = [
+            instance_filter_values[i:i + RDS_FILTER_BATCH_SIZE]
+            for i in range(0, len(instance_filter_values), RDS_FILTER_BATCH_SIZE)
+        ]
+        for instances in map_concurrently(describe_instances, instance_filter_batches):
+            for instance in instances:
                 if use_instance_ids:
                     # Using specific instance IDs - use indexed keys
-                    should_include = instance['DBInstanceIdentifier'] in identifier
-                    if should_include:
-                        instance_index += 1
-                        instance_id = instance['DBInstanceIdentifier']
-                        filtered_instances[f"rds_db_instance_{instance_index}"] = {
-                            "compareIdentifier": instance_id,
-                            **instance
-                        }
+                    instance_index += 1
+                    instance_id = instance['DBInstanceIdentifier']
+                    filtered_instances[f"rds_db_instance_{instance_index}"] = {
+                        "compareIdentifier": instance_id,
+                        **instance
+                    }
                 else:
                     # Using ApplicationShortName - use instance names as keys
-                    tag_list = instance.get('TagList', [])
-                    for tag in tag_list:
-                        if tag['Key'] == 'ApplicationShortName' and tag['Value'] == identifier:
-                            filtered_instances[instance['DBInstanceIdentifier']] = instance
-                            break
+                    filtered_instances[instance['DBInstanceIdentifier']] = instance
 
         if not filtered_instances:
-            print(f"No RDS instances found for {'instance IDs' if use_instance_ids else 'ApplicationShortName'} = {identifier}")
+            _log(f"No RDS instances found for {'instance IDs' if use_instance_ids else 'ApplicationShortName'} = {identifier}")
 
         return filtered_instances
     except Exception as e:
-        print(f"Error fetching RDS configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching RDS configurations: {e}")
+        return filtered_instances
 
 
 def fetch_parameter_store_config(prefixes, use_custom_names=True):
@@ -205,62 +455,65 @@ def fetch_parameter_store_config(prefixes, use_custom_names=True):
     Automatically constructs the full path using the prefixes.
     Returns parameters grouped by prefix.
     """
-    ssm_client = boto3.client('ssm', region_name='us-east-1')
+    ssm_client = get_client('ssm')
     all_parameters = {}
     prefix_index = 0
 
-    for prefix in prefixes:
-        prefix_index += 1
-        # Remove leading/trailing slashes from the prefix
-        prefix = prefix.strip('/')
+    # Remove leading/trailing slashes from the prefixes and construct the Parameter Store paths
+    parameter_paths = [f"/{prefix.strip('/')}/" for prefix in prefixes]
 
-        # Construct the Parameter Store path
-        parameter_path = f'/{prefix}/'
+    def get_parameters(parameter_path):
+        """
+        Returns (parameters, error) for every parameter under parameter_path; runs on the worker pool.
+        """
         parameters = []
-
         try:
-            next_token = None
-            while True:
-                # Pass NextToken only if it has a valid value
-                if next_token:
-                    response = ssm_client.get_parameters_by_path(Path=parameter_path, Recursive=True, NextToken=next_token)
-                else:
-                    response = ssm_client.get_parameters_by_path(Path=parameter_path, Recursive=True)
-
-                parameters.extend(response.get('Parameters', []))
-                next_token = response.get('NextToken')
-
-                if not next_token:
-                    break
+            # get_parameters_by_path returns at most 10 parameters per page
+            paginator = ssm_client.get_paginator('get_parameters_by_path')
+            for page in paginator.paginate(
+                Path=parameter_path,
+                Recursive=True,
+                WithDecryption=False,
+                PaginationConfig={'PageSize': 10}
+            ):
+                parameters.extend(page.get('Parameters', []))
+            return parameters, None
+        except Exception as e:
+            return parameters, e
 
-            if not parameters:
-                print(f"No parameters found under path '{parameter_path}'.")
-                if use_custom_names:
-                    all_parameters[f"parameter_prefix_{prefix_index}"] = {
-                        "compareIdentifier": parameter_path
-                    }
-                else:
-                    all_parameters[parameter_path] = {}
-                continue
+    # Fetch all prefixes concurrently, then report them in the original order
+    for parameter_path, (parameters, error) in zip(parameter_paths, map_concurrently(get_parameters, parameter_paths)):
+        prefix_index += 1
 
-            # Extract and return parameters as a dictionary, removing the prefix from the parameter names
+        if error is not None:
+            _log(f"Error fetching Parameter Store configurations for {parameter_path}: {error}")
             if use_custom_names:
                 all_parameters[f"parameter_prefix_{prefix_index}"] = {
-                    "compareIdentifier": parameter_path,
-                    **{param['Name'].replace(parameter_path, '', 1): param['Value'] for param in parameters}
+                    "compareIdentifier": parameter_path
                 }
             else:
-                all_parameters[parameter_path] = {
-                    **{param['Name'].replace(parameter_path, '', 1): param['Value'] for param in parameters}
-                }
-        except Exception as e:
-            print(f"Error fetching Parameter Store configurations for {parameter_path}: {e}")
+                all_parameters[parameter_path] = {}
+            continue
+
+        if not parameters:
+            _log(f"No parameters found under path '{parameter_path}'.")
             if use_custom_names:
                 all_parameters[f"parameter_prefix_{prefix_index}"] = {
                     "compareIdentifier": parameter_path
                 }
             else:
                 all_parameters[parameter_path] = {}
+            continue
+
+        # Extract and return parameters as a dictionary, removing the prefix from the parameter names
+        parameter_values = {param['Name'].removeprefix(parameter_path): param['Value'] for param in parameters}
+        if use_custom_names:
+            all_parameters[f"parameter_prefix_{prefix_index}"] = {
+                "compareIdentifier": parameter_path,
+                **parameter_values
+            }
+        else:
+            all_parameters[parameter_path] = parameter_values
 
     return all_parameters
 
@@ -270,64 +523,62 @@ def fetch_lambda_config(identifier, use_function_names=False):
     Fetches Lambda function configurations either by function names or ApplicationShortName.
     Returns functions with indexed keys or function names as keys based on the mode.
     """
-    lambda_client = boto3.client(service_name='lambda', region_name='us-east-1')
+    lambda_client = get_client('lambda')
     all_lambda_configs = {}
     function_index = 0
 
     try:
         if use_function_names:
             # Fetch specific functions by name - use indexed keys
-            for function_name in identifier:
-                function_index += 1
+            def get_function(function_name):
                 try:
-                    function_config = lambda_client.get_function(FunctionName=function_name)
-                    if 'Code' in function_config:
-                        del function_config['Code']
-                    
-                    all_lambda_configs[f"lambda_function_{function_index}"] = {
-                        "compareIdentifier": function_name,
-                        **function_config["Configuration"]
-                    }
-                    
+                    function_config = lambda_client.get_function_configuration(FunctionName=function_name)
+                    function_config.pop('ResponseMetadata', None)
+                    return function_config
                 except lambda_client.exceptions.ResourceNotFoundException:
-                    print(f"Lambda function not found: {function_name}")
-                    continue
+                    _log(f"Lambda function not found: {function_name}")
                 except Exception as e:
-                    print(f"Error fetching configuration for Lambda function {function_name}: {e}")
+                    _log(f"Error fetching configuration for Lambda function {function_name}: {e}")
+                return None
+
+            function_configs = map_concurrently(get_function, identifier)
+            for function_name, function_config in zip(identifier, function_configs):
+                function_index += 1
+                if function_config is None:
                     continue
+                all_lambda_configs[f"lambda_function_{function_index}"] = {
+                    "compareIdentifier": function_name,
+                    **function_config
+                }
         else:
-            # Fetch all functions and filter by ApplicationShortName tag - use function names as keys
-            paginator = lambda_client.get_paginator('list_functions')
-            for page in paginator.paginate():
-                for function in page['Functions']:
-                    try:
-                        # Get function tags
-                        tags_response = lambda_client.list_tags(Resource=function['FunctionArn'])
-                        tags = tags_response.get('Tags', {})
-                        
-                        # Check if function has matching ApplicationShortName tag
-                        if tags.get('ApplicationShortName') == identifier:
-                            function_config = lambda_client.get_function(FunctionName=function['FunctionName'])
-                            if 'Code' in function_config:
-                                del function_config['Code']
-                            
-                            # Use function name as key instead of indexed key
-                            all_lambda_configs[function['FunctionName']] = {
-                                **function_config["Configuration"]
-                            }
-                            
+            # Find functions by ApplicationShortName tag - use function names as keys
+            function_arns = find_tagged_resource_arns('lambda:function', 'ApplicationShortName', identifier)
+            # arn:aws:lambda:<region>:<account>:function:<name>
+            function_names = [function_arn.split(':')[6] for function_arn in function_arns]
 
-                    except Exception as e:
-                        print(f"Error processing Lambda function {function['FunctionName']}: {e}")
-                        continue
+            def get_tagged_function(function_name):
+                try:
+                    function_config = lambda_client.get_function_configuration(FunctionName=function_name)
+                    function_config.pop('ResponseMetadata', None)
+                    return function_config
+                except Exception as e:
+                    _log(f"Error processing Lambda function {function_name}: {e}")
+                return None
+
+            for function_name, function_config in zip(function_names, map_concurrently(get_tagged_function, function_names)):
+                if function_config is not None:
+                    # Use function name as key instead of indexed key
+                    all_lambda_configs[function_name] = {
+                        **function_config
+                    }
 
         if not all_lambda_configs:
-            print(f"No Lambda functions found for {'function names' if use_function_names else 'ApplicationShortName'} = {identifier}")
+            _log(f"No Lambda functions found for {'function names' if use_function_names else 'ApplicationShortName'} = {identifier}")
             
         return all_lambda_configs
     except Exception as e:
-        print(f"Error fetching Lambda configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching Lambda configurations: {e}")
+        return all_lambda_configs
 
 
 def fetch_elb_config(identifier, use_lb_names=False):
@@ -335,53 +586,78 @@ def fetch_elb_config(identifier, use_lb_names=False):
     Fetches the configuration of EC2 load balancers either by load balancer names or ApplicationShortName.
     Returns load balancers with indexed keys or load balancer names as keys based on the mode.
     """
-    elb_client = boto3.client('elbv2', region_name='us-east-1')
+    elb_client = get_client('elbv2')
     all_elb_configs = {}
     elb_index = 0
 
     try:
         if use_lb_names:
             # Fetch specific load balancers by name - use indexed keys
-            for lb_name in identifier:
-                elb_index += 1
+            def describe_load_balancer(lb_name):
                 try:
-                    lb_details = elb_client.describe_load_balancers(Names=[lb_name])
-                    for lb_config in lb_details['LoadBalancers']:
-                        all_elb_configs[f"elb_{elb_index}"] = {
-                            "compareIdentifier": lb_name,
-                            **lb_config
-                        }
+                    return elb_client.describe_load_balancers(Names=[lb_name])['LoadBalancers']
                 except elb_client.exceptions.LoadBalancerNotFoundException:
-                    print(f"Load balancer not found: {lb_name}")
-                    continue
+                    _log(f"Load balancer not found: {lb_name}")
                 except Exception as e:
-                    print(f"Error fetching configuration for load balancer {lb_name}: {e}")
-                    continue
+                    _log(f"Error fetching configuration for load balancer {lb_name}: {e}")
+                return []
+
+            def describe_load_balancer_batch(lb_name_batch):
+                try:
+                    load_balancers = elb_client.describe_load_balancers(Names=lb_name_batch)['LoadBalancers']
+                except Exception:
+                    # One missing name fails the whole request; retry name by name so only the failures are reported
+                    return [describe_load_balancer(lb_name) for lb_name in lb_name_batch]
+                lbs_by_name = {lb['LoadBalancerName']: [lb] for lb in load_balancers}
+                return [lbs_by_name.get(lb_name, []) for lb_name in lb_name_batch]
+
+            lb_name_batches = [
+                identifier[i:i + ELB_DESCRIBE_BATCH_SIZE]
+                for i in range(0, len(identifier), ELB_DESCRIBE_BATCH_SIZE)
+            ]
+            lb_configs = [
+                lb_details
+                for batch_details in map_concurrently(describe_load_balancer_batch, lb_name_batches)
+                for lb_details in batch_details
+            ]
+            for lb_name, lb_details in zip(identifier, lb_configs):
+                elb_index += 1
+                for lb_config in lb_details:
+                    all_elb_configs[f"elb_{elb_index}"] = {
+                        "compareIdentifier": lb_name,
+                        **lb_config
+                    }
         else:
-            # Fetch all load balancers and filter by ApplicationShortName tag - use load balancer names as keys
-            paginator = elb_client.get_paginator('describe_load_balancers')
-            for page in paginator.paginate():
-                for lb in page['LoadBalancers']:
-                    try:
-                        # Get load balancer tags
-                        tags_response = elb_client.describe_tags(ResourceArns=[lb['LoadBalancerArn']])
-                        tags = tags_response.get('TagDescriptions', [{}])[0].get('Tags', [])
-                        
-                        # Check if load balancer has matching ApplicationShortName tag
-                        if any(tag['Key'] == 'ApplicationShortName' and tag['Value'] == identifier for tag in tags):
-                            all_elb_configs[lb['LoadBalancerName']] = lb
+            # Find load balancers by ApplicationShortName tag - use load balancer names as keys
+            lb_arns = [
+                lb_arn
+                for lb_arn in find_tagged_resource_arns('elasticloadbalancing:loadbalancer', 'ApplicationShortName', identifier)
+                # elbv2 ARNs are loadbalancer/<type>/<name>/<id>; classic load balancers are loadbalancer/<name>
+                if lb_arn.split(':loadbalancer/')[-1].count('/') == 2
+            ]
+            lb_arn_batches = [
+                lb_arns[i:i + ELB_DESCRIBE_BATCH_SIZE]
+                for i in range(0, len(lb_arns), ELB_DESCRIBE_BATCH_SIZE)
+            ]
+
+            def describe_load_balancer_batch(lb_arn_batch):
+                try:
+                    return elb_client.describe_load_balancers(LoadBalancerArns=lb_arn_batch)['LoadBalancers']
+                except Exception as e:
+                    _log(f"Error processing load balancers {', '.join(lb_arn_batch)}: {e}")
+                    return []
 
-                    except Exception as e:
-                        print(f"Error processing load balancer {lb['LoadBalancerName']}: {e}")
-                        continue
+            for load_balancers in map_concurrently(describe_load_balancer_batch, lb_arn_batches):
+                for lb in load_balancers:
+                    all_elb_configs[lb['LoadBalancerName']] = lb
 
         if not all_elb_configs:
-            print(f"No EC2 load balancers found for {'load balancer names' if use_lb_names else 'ApplicationShortName'} = {identifier}")
+            _log(f"No EC2 load balancers found for {'load balancer names' if use_lb_names else 'ApplicationShortName'} = {identifier}")
             
         return all_elb_configs
     except Exception as e:
-        print(f"Error fetching EC2 load balancer configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching EC2 load balancer configurations: {e}")
+        return all_elb_configs
 
 
 def fetch_sqs_config(queue_names, ApplicationShortName):
@@ -389,52 +665,60 @@ def fetch_sqs_config(queue_names, ApplicationShortName):
     Fetches the configuration of SQS queues for specified queue names.
     Returns queues with indexed keys.
     """
-    sqs_client = boto3.client('sqs', region_name='us-east-1')
+    sqs_client = get_client('sqs')
     all_queue_configs = {}
     queue_index = 0
 
     try:
         if queue_names:
-            for queue_name in queue_names:
-                queue_index += 1
+            def get_named_queue_attributes(queue_name):
                 try:
                     queue_url = sqs_client.get_queue_url(QueueName=queue_name)['QueueUrl']
-                    queue_attributes = sqs_client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=['All'])['Attributes']
-                    all_queue_configs[f"sqs_queue_{queue_index}"] = {
-                        "compareIdentifier": queue_name,
-                        **queue_attributes
-                    }
+                    return sqs_client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=['All'])['Attributes']
                 except sqs_client.exceptions.QueueDoesNotExist:
-                    print(f"SQS queue not found: {queue_name}")
-                    continue
+                    _log(f"SQS queue not found: {queue_name}")
                 except Exception as e:
-                    print(f"Error fetching configuration for SQS queue {queue_name}: {e}")
+                    _log(f"Error fetching configuration for SQS queue {queue_name}: {e}")
+                return None
+
+            queue_attributes_list = map_concurrently(get_named_queue_attributes, queue_names)
+            for queue_name, queue_attributes in zip(queue_names, queue_attributes_list):
+                queue_index += 1
+                if queue_attributes is None:
                     continue
+                all_queue_configs[f"sqs_queue_{queue_index}"] = {
+                    "compareIdentifier": queue_name,
+                    **queue_attributes
+                }
         else:
-            # Fetch all SQS queues and filter by ApplicationShortName tag
-            list_queues_response = sqs_client.list_queues()
-            queue_urls = list_queues_response.get('QueueUrls', [])
-            for queue_url in queue_urls:
+            # Find SQS queues by ApplicationShortName tag
+            queue_arns = find_tagged_resource_arns('sqs', 'ApplicationShortName', ApplicationShortName)
+
+            def get_tagged_queue_attributes(queue_arn):
+                # arn:aws:sqs:<region>:<account>:<name>
+                queue_owner, queue_name = queue_arn.split(':')[4:6]
                 try:
-                    tags_response = sqs_client.list_queue_tags(QueueUrl=queue_url)
-                    tags = tags_response.get('Tags', {})
-                    if tags.get('ApplicationShortName') == ApplicationShortName:
-                        queue_attributes = sqs_client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=['All'])['Attributes']
-                        queue_name = queue_url.split('/')[-1]
-                        all_queue_configs[f"{queue_name}"] = {
-                            **queue_attributes
-                        }
+                    queue_url = sqs_client.get_queue_url(QueueName=queue_name, QueueOwnerAWSAccountId=queue_owner)['QueueUrl']
+                    return sqs_client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=['All'])['Attributes']
                 except Exception as e:
-                    print(f"Error processing SQS queue {queue_url}: {e}")
-                    continue
+                    _log(f"Error processing SQS queue {queue_name}: {e}")
+                return None
+
+            queue_attributes_list = map_concurrently(get_tagged_queue_attributes, queue_arns)
+            for queue_arn, queue_attributes in zip(queue_arns, queue_attributes_list):
+                if queue_attributes is not None:
+                    queue_name = queue_arn.split(':')[-1]
+                    all_queue_configs[f"{queue_name}"] = {
+                        **queue_attributes
+                    }
 
         if not all_queue_configs:
-            print(f"No SQS queues found for the provided queue names or ApplicationShortName.")
+            _log(f"No SQS queues found for the provided queue names or ApplicationShortName.")
             
         return all_queue_configs
     except Exception as e:
-        print(f"Error fetching SQS configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching SQS configurations: {e}")
+        return all_queue_configs
 
 
 def fetch_sns_config(identifier, use_topic_names=False):
@@ -442,7 +726,7 @@ def fetch_sns_config(identifier, use_topic_names=False):
     Fetches the configuration of SNS topics either by topic names or ApplicationShortName.
     Returns topics with indexed keys or topic names as keys based on the mode.
     """
-    sns_client = boto3.client('sns', region_name='us-east-1')
+    sns_client = get_client('sns')
     all_sns_configs = {}
     topic_index = 0
 
@@ -455,70 +739,96 @@ def fetch_sns_config(identifier, use_topic_names=False):
                 all_topics.extend(page.get('Topics', []))
             
             # Filter topics by the specified names
-            for topic_name in identifier:
-                topic_index += 1
+            def get_named_topic(topic_name):
                 # Find the topic ARN that ends with the specified name
                 topic_arn = next((t['TopicArn'] for t in all_topics if t['TopicArn'].split(':')[-1] == topic_name), None)
                 
                 if not topic_arn:
-                    print(f"SNS topic not found: {topic_name}")
-                    continue
+                    _log(f"SNS topic not found: {topic_name}")
+                    return None
                 
                 try:
                     # Get comprehensive topic details
-                    topic_data = fetch_sns_topic_details(sns_client, topic_arn, topic_name)
-                    
-                    # Store topic config with all details
-                    all_sns_configs[f"sns_topic_{topic_index}"] = {
-                        "compareIdentifier": topic_name,
-                        **topic_data
-                    }
-                    
+                    return fetch_sns_topic_details(sns_client, topic_arn, topic_name)
                 except Exception as e:
-                    print(f"Error fetching configuration for SNS topic {topic_name}: {e}")
+                    _log(f"Error fetching configuration for SNS topic {topic_name}: {e}")
+                    return None
+
+            for topic_name, topic_data in zip(identifier, map_concurrently(get_named_topic, identifier)):
+                topic_index += 1
+                if topic_data is None:
                     continue
+                
+                # Store topic config with all details
+                all_sns_configs[f"sns_topic_{topic_index}"] = {
+                    "compareIdentifier": topic_name,
+                    **topic_data
+                }
         else:
             # Fetch all topics and filter by ApplicationShortName tag - use topic names as keys
+            topics = []
             paginator = sns_client.get_paginator('list_topics')
             for page in paginator.paginate():
-                for topic in page['Topics']:
-                    topic_arn = topic['TopicArn']
-                    try:
-                        # Get topic attributes and tags
-                        topic_attributes = sns_client.get_topic_attributes(TopicArn=topic_arn)['Attributes']
-                        tags_response = sns_client.list_tags_for_resource(ResourceArn=topic_arn)
-                        tags = tags_response.get('Tags', [])
+                topics.extend(page['Topics'])
+
+            def get_tagged_topic(topic):
+                topic_arn = topic['TopicArn']
+                try:
+                    # Get topic attributes and tags
+                    topic_attributes = sns_client.get_topic_attributes(TopicArn=topic_arn)['Attributes']
+                    tags_response = sns_client.list_tags_for_resource(ResourceArn=topic_arn)
+                    tag_map = {tag['Key']: tag['Value'] for tag in tags_response.get('Tags', [])}
+                    
+                    # Check if topic has matching ApplicationShortName tag
+                    if tag_map.get('ApplicationShortName') == identifier:
+                        # Get topic name from ARN
+                        topic_name = topic_arn.split(':')[-1]
                         
-                        # Check if topic has matching ApplicationShortName tag
-                        if any(tag['Key'] == 'ApplicationShortName' and tag['Value'] == identifier for tag in tags):
-                            # Get topic name from ARN
-                            topic_name = topic_arn.split(':')[-1]
-                            
-                            # Get comprehensive topic details
-                            topic_data = fetch_sns_topic_details(sns_client, topic_arn, topic_name)
-                            
-                            # Use topic name as key instead of indexed key
-                            all_sns_configs[topic_name] = topic_data
-                            
-                    except Exception as e:
-                        print(f"Error processing SNS topic {topic_arn}: {e}")
-                        continue
+                        # Get comprehensive topic details
+                        return topic_name, fetch_sns_topic_details(sns_client, topic_arn, topic_name)
+                        
+                except Exception as e:
+                    _log(f"Error processing SNS topic {topic_arn}: {e}")
+                return None
+
+            for matched in map_concurrently(get_tagged_topic, topics):
+                if matched is not None:
+                    # Use topic name as key instead of indexed key
+                    topic_name, topic_data = matched
+                    all_sns_configs[topic_name] = topic_data
 
         if not all_sns_configs:
-            print(f"No SNS topics found for {'topic names' if use_topic_names else 'ApplicationShortName'} = {identifier}")
+            _log(f"No SNS topics found for {'topic names' if use_topic_names else 'ApplicationShortName'} = {identifier}")
             
         return all_sns_configs
     except Exception as e:
-        print(f"Error fetching SNS configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching SNS configurations: {e}")
+        return all_sns_configs
 
 
 def fetch_sns_topic_details(sns_client, topic_arn, topic_name):
     """
     Helper function to fetch comprehensive details for an SNS topic.
+    The attributes, tags and subscription listing are independent, so they are fetched concurrently.
     """
-    # Get topic attributes
-    topic_attributes = sns_client.get_topic_attributes(TopicArn=topic_arn)['Attributes']
+    def get_topic_attributes():
+        return sns_client.get_topic_attributes(TopicArn=topic_arn)['Attributes']
+
+    def get_topic_tags():
+        return sns_client.list_tags_for_resource(ResourceArn=topic_arn).get('Tags', [])
+
+    def get_subscriptions():
+        # Get subscriptions for this topic
+        subscriptions = []
+        subscription_paginator = sns_client.get_paginator('list_subscriptions_by_topic')
+        for sub_page in subscription_paginator.paginate(TopicArn=topic_arn):
+            subscriptions.extend(sub_page.get('Subscriptions', []))
+        return subscriptions
+
+    topic_attributes, topic_tags, subscriptions = map_concurrently(
+        lambda fetch: fetch(),
+        [get_topic_attributes, get_topic_tags, get_subscriptions]
+    )
     
     # Create the base topic details object with flattened attributes
     topic_details = {
@@ -530,21 +840,13 @@ def fetch_sns_topic_details(sns_client, topic_arn, topic_name):
     for attr_name, attr_value in topic_attributes.items():
         topic_details[f"Attributes.{attr_name}"] = attr_value
     
-    # Get subscriptions for this topic
-    subscriptions = []
-    subscription_paginator = sns_client.get_paginator('list_subscriptions_by_topic')
-    for sub_page in subscription_paginator.paginate(TopicArn=topic_arn):
-        subscriptions.extend(sub_page.get('Subscriptions', []))
-    
     # Get subscription details, including filter policies
-    detailed_subscriptions = []
-    for subscription in subscriptions:
+    def describe_subscription(subscription):
         try:
             sub_arn = subscription.get('SubscriptionArn')
             # Skip if subscription is pending confirmation
             if sub_arn == 'PendingConfirmation':
-                detailed_subscriptions.append(subscription)
-                continue
+                return subscription
                 
             sub_attributes = sns_client.get_subscription_attributes(SubscriptionArn=sub_arn)['Attributes']
             
@@ -553,16 +855,14 @@ def fetch_sns_topic_details(sns_client, topic_arn, topic_name):
             for sub_attr_name, sub_attr_value in sub_attributes.items():
                 detailed_subscription[f"Attributes.{sub_attr_name}"] = sub_attr_value
                 
-            detailed_subscriptions.append(detailed_subscription)
+            return detailed_subscription
         except Exception as e:
-            print(f"Error fetching details for subscription {subscription.get('SubscriptionArn')}: {e}")
-            detailed_subscriptions.append(subscription)
+            _log(f"Error fetching details for subscription {subscription.get('SubscriptionArn')}: {e}")
+            return subscription
     
-    topic_details["Subscriptions"] = detailed_subscriptions
+    topic_details["Subscriptions"] = map_concurrently(describe_subscription, subscriptions)
     
-    # Get topic tags
-    tags_response = sns_client.list_tags_for_resource(ResourceArn=topic_arn)
-    topic_details["Tags"] = tags_response.get('Tags', [])
+    topic_details["Tags"] = topic_tags
     
     # Check if topic is FIFO
     topic_details["IsFifo"] = topic_name.endswith('.fifo')
@@ -575,7 +875,7 @@ def fetch_kinesis_config(identifier, use_stream_names=False):
     Fetches the configuration of Kinesis data streams either by stream names or ApplicationShortName.
     Returns streams with indexed keys or stream names as keys based on the mode.
     """
-    kinesis_client = boto3.client('kinesis', region_name='us-east-1')
+    kinesis_client = get_client('kinesis')
     all_stream_configs = {}
     stream_index = 0
 
@@ -594,10 +894,10 @@ def fetch_kinesis_config(identifier, use_stream_names=False):
                     stream_desc_response = kinesis_client.describe_stream(StreamName=stream_name)
                     stream_desc = stream_desc_response.get('StreamDescription', {})
                 except kinesis_client.exceptions.ResourceNotFoundException:
-                    print(f"Kinesis stream not found: {stream_name}")
+                    _log(f"Kinesis stream not found: {stream_name}")
                     continue
                 except Exception as e:
-                    print(f"Error fetching details for Kinesis stream {stream_name}: {e}")
+                    _log(f"Error fetching details for Kinesis stream {stream_name}: {e}")
                     stream_desc = {}
                 
                 try:
@@ -605,7 +905,7 @@ def fetch_kinesis_config(identifier, use_stream_names=False):
                     tags_response = kinesis_client.list_tags_for_stream(StreamName=stream_name)
                     tags = tags_response.get('Tags', [])
                 except Exception as e:
-                    print(f"Error fetching tags for Kinesis stream {stream_name}: {e}")
+                    _log(f"Error fetching tags for Kinesis stream {stream_name}: {e}")
                     tags = []
                 
                 # Get consumer details if they exist and if we have a StreamARN
@@ -615,7 +915,7 @@ def fetch_kinesis_config(identifier, use_stream_names=False):
                         for page in consumer_paginator.paginate(StreamARN=stream_desc['StreamARN']):
                             consumers.extend(page.get('Consumers', []))
                     except Exception as e:
-                        print(f"Error fetching consumers for Kinesis stream {stream_name}: {e}")
+                        _log(f"Error fetching consumers for Kinesis stream {stream_name}: {e}")
                         consumers = []
                 
                 # Try to fetch stream limits
@@ -624,7 +924,7 @@ def fetch_kinesis_config(identifier, use_stream_names=False):
                     limits_response = kinesis_client.describe_limits()
                     limits = limits_response or {}
                 except Exception as e:
-                    print(f"Error fetching limits for Kinesis stream {stream_name}: {e}")
+                    _log(f"Error fetching limits for Kinesis stream {stream_name}: {e}")
                 
                 # Store with indexed key and include original stream name in config
                 all_stream_configs[f"kinesis_stream_{stream_index}"] = {
@@ -664,7 +964,7 @@ def fetch_kinesis_config(identifier, use_stream_names=False):
                                 for page in consumer_paginator.paginate(StreamARN=stream_desc['StreamARN']):
                                     consumers.extend(page.get('Consumers', []))
                             except Exception as e:
-                                print(f"Error fetching consumers for Kinesis stream {stream_name}: {e}")
+                                _log(f"Error fetching consumers for Kinesis stream {stream_name}: {e}")
                             
                             # Use stream name as key
                             all_stream_configs[stream_name] = {
@@ -682,15 +982,15 @@ def fetch_kinesis_config(identifier, use_stream_names=False):
                             }
                             
                     except Exception as e:
-                        print(f"Error processing Kinesis stream {stream_name}: {e}")
+                        _log(f"Error processing Kinesis stream {stream_name}: {e}")
                         continue
 
         if not all_stream_configs:
-            print(f"No Kinesis streams found for {'stream names' if use_stream_names else 'ApplicationShortName'} = {identifier}")
+            _log(f"No Kinesis streams found for {'stream names' if use_stream_names else 'ApplicationShortName'} = {identifier}")
             
         return all_stream_configs
     except Exception as e:
-        print(f"Error fetching Kinesis configurations: {e}")
+        _log(f"Error fetching Kinesis configurations: {e}")
         return {}
 
 def fetch_route53_config(identifier, use_zone_ids=False):
@@ -698,7 +998,7 @@ def fetch_route53_config(identifier, use_zone_ids=False):
     Fetches the configuration of Route 53 hosted zones either by zone IDs or ApplicationShortName.
     Returns zones with indexed keys or zone names as keys based on the mode.
     """
-    route53_client = boto3.client('route53', region_name='us-east-1')
+    route53_client = get_client('route53')
     all_zone_configs = {}
     zone_index = 0
 
@@ -742,10 +1042,10 @@ def fetch_route53_config(identifier, use_zone_ids=False):
                         "Records": records
                     }
                 except route53_client.exceptions.NoSuchHostedZone:
-                    print(f"Route 53 hosted zone not found: {zone_id}")
+                    _log(f"Route 53 hosted zone not found: {zone_id}")
                     continue
                 except Exception as e:
-                    print(f"Error fetching configuration for Route 53 hosted zone {zone_id}: {e}")
+                    _log(f"Error fetching configuration for Route 53 hosted zone {zone_id}: {e}")
                     continue
         else:
             # Fetch all zones and filter by ApplicationShortName tag - use zone names as keys
@@ -785,15 +1085,15 @@ def fetch_route53_config(identifier, use_zone_ids=False):
                             }
                             
                     except Exception as e:
-                        print(f"Error processing Route 53 hosted zone {zone.get('Name', zone_id)}: {e}")
+                        _log(f"Error processing Route 53 hosted zone {zone.get('Name', zone_id)}: {e}")
                         continue
 
         if not all_zone_configs:
-            print(f"No Route 53 hosted zones found for {'zone IDs' if use_zone_ids else 'ApplicationShortName'} = {identifier}")
+            _log(f"No Route 53 hosted zones found for {'zone IDs' if use_zone_ids else 'ApplicationShortName'} = {identifier}")
             
         return all_zone_configs
     except Exception as e:
-        print(f"Error fetching Route 53 configurations: {e}")
+        _log(f"Error fetching Route 53 configurations: {e}")
         return {}
 
 def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
@@ -801,7 +1101,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
     Fetches CloudWatch alarm configurations either by alarm names or ApplicationShortName.
     Returns alarms with indexed keys or alarm names as keys based on the mode.
     """
-    cloudwatch_client = boto3.client('cloudwatch', region_name='us-east-1')
+    cloudwatch_client = get_client('cloudwatch')
     all_alarm_configs = {}
     alarm_index = 0
 
@@ -817,7 +1117,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                     composite_alarms = alarm_response.get('CompositeAlarms', [])
                     
                     if not metric_alarms and not composite_alarms:
-                        print(f"CloudWatch alarm not found: {alarm_name}")
+                        _log(f"CloudWatch alarm not found: {alarm_name}")
                         continue
                     
                     # Get alarm tags
@@ -874,7 +1174,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                                     metric_alarms[0]['MetricMetadata'] = metric_metadata
                                     
                                 except Exception as e:
-                                    print(f"Error fetching metric data for alarm {alarm_name}: {e}")
+                                    _log(f"Error fetching metric data for alarm {alarm_name}: {e}")
                             
                             # Get dashboards where this alarm might be used
                             try:
@@ -898,7 +1198,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                                 
                                 metric_alarms[0]['RelatedDashboards'] = related_dashboards
                             except Exception as e:
-                                print(f"Error fetching related dashboards for alarm {alarm_name}: {e}")
+                                _log(f"Error fetching related dashboards for alarm {alarm_name}: {e}")
                         
                         # For composite alarms
                         if composite_alarms:
@@ -928,10 +1228,10 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                                             'CompositeAlarms': referenced_alarms_response.get('CompositeAlarms', [])
                                         }
                                     except Exception as e:
-                                        print(f"Error fetching referenced alarms for composite alarm {alarm_name}: {e}")
+                                        _log(f"Error fetching referenced alarms for composite alarm {alarm_name}: {e}")
                            
                     except Exception as e:
-                        print(f"Error fetching tags for CloudWatch alarm {alarm_name}: {e}")
+                        _log(f"Error fetching tags for CloudWatch alarm {alarm_name}: {e}")
                     
                     # Store alarm config
                     if metric_alarms:
@@ -948,7 +1248,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                         }
                     
                 except Exception as e:
-                    print(f"Error fetching configuration for CloudWatch alarm {alarm_name}: {e}")
+                    _log(f"Error fetching configuration for CloudWatch alarm {alarm_name}: {e}")
                     continue
         else:
             # Fetch all alarms and filter by ApplicationShortName tag - use alarm names as keys
@@ -1013,7 +1313,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                                     alarm['MetricMetadata'] = metric_metadata
                                     
                                 except Exception as e:
-                                    print(f"Error fetching metric data for alarm {alarm_name}: {e}")
+                                    _log(f"Error fetching metric data for alarm {alarm_name}: {e}")
                             
                             # Get dashboards where this alarm might be used
                             try:
@@ -1037,7 +1337,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                                 
                                 alarm['RelatedDashboards'] = related_dashboards
                             except Exception as e:
-                                print(f"Error fetching related dashboards for alarm {alarm_name}: {e}")
+                                _log(f"Error fetching related dashboards for alarm {alarm_name}: {e}")
                             
                             # Use alarm name as key
                             all_alarm_configs[alarm_name] = {
@@ -1045,7 +1345,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                                 **alarm
                             }
                     except Exception as e:
-                        print(f"Error processing MetricAlarm {alarm.get('AlarmName')}: {e}")
+                        _log(f"Error processing MetricAlarm {alarm.get('AlarmName')}: {e}")
                         continue
             
             # Then get all CompositeAlarms
@@ -1085,7 +1385,7 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                                             'CompositeAlarms': referenced_alarms_response.get('CompositeAlarms', [])
                                         }
                                     except Exception as e:
-                                        print(f"Error fetching referenced alarms for composite alarm {alarm_name}: {e}")
+                                        _log(f"Error fetching referenced alarms for composite alarm {alarm_name}: {e}")
                             
                             # Use alarm name as key
                             all_alarm_configs[alarm_name] = {
@@ -1093,16 +1393,16 @@ def fetch_cloudwatch_alarms(identifier, use_alarm_names=False):
                                 **alarm
                             }
                     except Exception as e:
-                        print(f"Error processing CompositeAlarm {alarm.get('AlarmName')}: {e}")
+                        _log(f"Error processing CompositeAlarm {alarm.get('AlarmName')}: {e}")
                         continue
 
         if not all_alarm_configs:
-            print(f"No CloudWatch alarms found for {'alarm names' if use_alarm_names else 'ApplicationShortName'} = {identifier}")
+            _log(f"No CloudWatch alarms found for {'alarm names' if use_alarm_names else 'ApplicationShortName'} = {identifier}")
             
         return all_alarm_configs
     except Exception as e:
-        print(f"Error fetching CloudWatch alarm configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching CloudWatch alarm configurations: {e}")
+        return all_alarm_configs
 
 
 def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
@@ -1121,7 +1421,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
         }
     ]
     """
-    appmesh_client = boto3.client('appmesh', region_name='us-east-1')
+    appmesh_client = get_client('appmesh')
     all_mesh_configs = {}
     mesh_index = 0
 
@@ -1146,7 +1446,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                     )
                     mesh_data['tags'] = tags_response.get('tags', [])
                 except Exception as e:
-                    print(f"Error fetching tags for App Mesh {mesh_name}: {e}")
+                    _log(f"Error fetching tags for App Mesh {mesh_name}: {e}")
                     mesh_data['tags'] = []
 
                 # Store mesh configuration
@@ -1166,7 +1466,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                             for vgw in vgw_page.get('virtualGateways', []):
                                 gateway_names.append(vgw.get('virtualGatewayName'))
                     except Exception as e:
-                        print(f"Error listing virtual gateways: {e}")
+                        _log(f"Error listing virtual gateways: {e}")
 
                 for gateway_name in gateway_names:
                     gateway_index += 1
@@ -1202,7 +1502,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                                     **gr_details.get('gatewayRoute', {})
                                 }
                     except Exception as e:
-                        print(f"Error fetching virtual gateway {gateway_name}: {e}")
+                        _log(f"Error fetching virtual gateway {gateway_name}: {e}")
 
                 # Fetch virtual nodes
                 node_index = 0
@@ -1214,7 +1514,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                             for vn in vn_page.get('virtualNodes', []):
                                 node_names.append(vn.get('virtualNodeName'))
                     except Exception as e:
-                        print(f"Error listing virtual nodes: {e}")
+                        _log(f"Error listing virtual nodes: {e}")
 
                 for node_name in node_names:
                     node_index += 1
@@ -1229,7 +1529,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                             **vn_details.get('virtualNode', {})
                         }
                     except Exception as e:
-                        print(f"Error fetching virtual node {node_name}: {e}")
+                        _log(f"Error fetching virtual node {node_name}: {e}")
 
                 # Fetch virtual routers
                 router_index = 0
@@ -1241,7 +1541,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                             for vr in vr_page.get('virtualRouters', []):
                                 router_names.append(vr.get('virtualRouterName'))
                     except Exception as e:
-                        print(f"Error listing virtual routers: {e}")
+                        _log(f"Error listing virtual routers: {e}")
 
                 for router_name in router_names:
                     router_index += 1
@@ -1277,7 +1577,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                                     **route_details.get('route', {})
                                 }
                     except Exception as e:
-                        print(f"Error fetching virtual router {router_name}: {e}")
+                        _log(f"Error fetching virtual router {router_name}: {e}")
 
                 # Fetch virtual services
                 service_index = 0
@@ -1289,7 +1589,7 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                             for vs in vs_page.get('virtualServices', []):
                                 service_names.append(vs.get('virtualServiceName'))
                     except Exception as e:
-                        print(f"Error listing virtual services: {e}")
+                        _log(f"Error listing virtual services: {e}")
 
                 for service_name in service_names:
                     service_index += 1
@@ -1304,19 +1604,19 @@ def fetch_appmesh_config(mesh_configs, use_custom_identifier=False):
                             **vs_details.get('virtualService', {})
                         }
                     except Exception as e:
-                        print(f"Error fetching virtual service {service_name}: {e}")
+                        _log(f"Error fetching virtual service {service_name}: {e}")
 
             except appmesh_client.exceptions.NotFoundException:
-                print(f"App Mesh not found: {mesh_name}")
+                _log(f"App Mesh not found: {mesh_name}")
                 continue
             except Exception as e:
-                print(f"Error processing mesh {mesh_name}: {e}")
+                _log(f"Error processing mesh {mesh_name}: {e}")
                 continue
 
         return all_mesh_configs
     except Exception as e:
-        print(f"Error fetching App Mesh configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching App Mesh configurations: {e}")
+        return all_mesh_configs
 
 
 def fetch_cloudmap_config(namespace_configs, use_custom_identifier=False):
@@ -1332,7 +1632,7 @@ def fetch_cloudmap_config(namespace_configs, use_custom_identifier=False):
         }
     ]
     """
-    cloudmap_client = boto3.client('servicediscovery', region_name='us-east-1')
+    cloudmap_client = get_client('servicediscovery')
     all_cloudmap_configs = {}
     namespace_index = 0
 
@@ -1354,7 +1654,7 @@ def fetch_cloudmap_config(namespace_configs, use_custom_identifier=False):
                     )
                     namespace_data['tags'] = tags_response.get('Tags', [])
                 except Exception as e:
-                    print(f"Error fetching tags for Cloud Map namespace {namespace_name}: {e}")
+                    _log(f"Error fetching tags for Cloud Map namespace {namespace_name}: {e}")
                     namespace_data['tags'] = []
 
                 # Store namespace configuration
@@ -1372,7 +1672,7 @@ def fetch_cloudmap_config(namespace_configs, use_custom_identifier=False):
                             for service in service_page.get('Services', []):
                                 service_names.append(service.get('Name'))
                     except Exception as e:
-                        print(f"Error listing services for namespace {namespace_name}: {e}")
+                        _log(f"Error listing services for namespace {namespace_name}: {e}")
 
                 # Fetch service details
                 service_index = 0
@@ -1392,7 +1692,7 @@ def fetch_cloudmap_config(namespace_configs, use_custom_identifier=False):
                             )
                             service_data['tags'] = service_tags.get('Tags', [])
                         except Exception as e:
-                            print(f"Error fetching tags for service {service_name}: {e}")
+                            _log(f"Error fetching tags for service {service_name}: {e}")
                             service_data['tags'] = []
 
                         # Store service configuration
@@ -1415,29 +1715,29 @@ def fetch_cloudmap_config(namespace_configs, use_custom_identifier=False):
                                         **instance
                                     }
                         except Exception as e:
-                            print(f"Error fetching instances for service {service_name}: {e}")
+                            _log(f"Error fetching instances for service {service_name}: {e}")
 
                     except Exception as e:
-                        print(f"Error fetching service {service_name}: {e}")
+                        _log(f"Error fetching service {service_name}: {e}")
 
             except cloudmap_client.exceptions.NamespaceNotFound:
-                print(f"Cloud Map namespace not found: {namespace_name}")
+                _log(f"Cloud Map namespace not found: {namespace_name}")
                 continue
             except Exception as e:
-                print(f"Error processing namespace {namespace_name}: {e}")
+                _log(f"Error processing namespace {namespace_name}: {e}")
                 continue
 
         return all_cloudmap_configs
     except Exception as e:
-        print(f"Error fetching Cloud Map configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching Cloud Map configurations: {e}")
+        return all_cloudmap_configs
 
 
 def find_appmesh_meshes(team_tag_key='ApplicationShortName', team_tag_value=''):
     """
     Finds all App Mesh meshes for a given ApplicationShortName tag value.
     """
-    appmesh_client = boto3.client('appmesh', region_name='us-east-1')
+    appmesh_client = get_client('appmesh')
     matching_meshes = []
 
     try:
@@ -1457,21 +1757,21 @@ def find_appmesh_meshes(team_tag_key='ApplicationShortName', team_tag_value=''):
                         if tag['key'] == team_tag_key and tag['value'] == team_tag_value:
                             matching_meshes.append(mesh.get('meshName'))
                 except Exception as e:
-                    print(f"Error fetching tags for mesh {mesh.get('meshName')}: {e}")
+                    _log(f"Error fetching tags for mesh {mesh.get('meshName')}: {e}")
                     continue
 
         if not matching_meshes:
-            print(f"No App Mesh meshes found for {team_tag_key} = {team_tag_value}")
+            _log(f"No App Mesh meshes found for {team_tag_key} = {team_tag_value}")
         return matching_meshes
     except Exception as e:
-        print(f"Error finding App Mesh meshes: {e}")
-        sys.exit(1)
+        _log(f"Error finding App Mesh meshes: {e}")
+        return matching_meshes
 
 def find_cloudmap_namespaces(team_tag_key='ApplicationShortName', team_tag_value=''):
     """
     Finds all Cloud Map namespaces for a given ApplicationShortName tag value.
     """
-    cloudmap_client = boto3.client('servicediscovery', region_name='us-east-1')
+    cloudmap_client = get_client('servicediscovery')
     matching_namespaces = []
 
     try:
@@ -1491,15 +1791,15 @@ def find_cloudmap_namespaces(team_tag_key='ApplicationShortName', team_tag_value
                         if tag['Key'] == team_tag_key and tag['Value'] == team_tag_value:
                             matching_namespaces.append(namespace.get('Id'))
                 except Exception as e:
-                    print(f"Error fetching tags for namespace {namespace.get('Name')}: {e}")
+                    _log(f"Error fetching tags for namespace {namespace.get('Name')}: {e}")
                     continue
 
         if not matching_namespaces:
-            print(f"No Cloud Map namespaces found for {team_tag_key} = {team_tag_value}")
+            _log(f"No Cloud Map namespaces found for {team_tag_key} = {team_tag_value}")
         return matching_namespaces
     except Exception as e:
-        print(f"Error finding Cloud Map namespaces: {e}")
-        sys.exit(1)
+        _log(f"Error finding Cloud Map namespaces: {e}")
+        return matching_namespaces
 
 
 def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
@@ -1515,7 +1815,7 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
         }
     ]
     """
-    events_client = boto3.client('events', region_name='us-east-1')
+    events_client = get_client('events')
     all_eventbridge_configs = {}
     bus_index = 0
 
@@ -1538,7 +1838,7 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                         )
                         bus_data['tags'] = tags_response.get('Tags', [])
                     except Exception as e:
-                        print(f"Error fetching tags for EventBridge bus {event_bus_name}: {e}")
+                        _log(f"Error fetching tags for EventBridge bus {event_bus_name}: {e}")
                         bus_data['tags'] = []
 
                 # Get API destinations (no pagination)
@@ -1552,11 +1852,11 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                             )
                             api_destinations.append(destination_details.get('ApiDestination', {}))
                         except Exception as e:
-                            print(f"Error fetching details for API destination {destination.get('Name')}: {e}")
+                            _log(f"Error fetching details for API destination {destination.get('Name')}: {e}")
                             api_destinations.append(destination)
                     bus_data['api_destinations'] = api_destinations
                 except Exception as e:
-                    print(f"Error fetching API destinations for EventBridge bus {event_bus_name}: {e}")
+                    _log(f"Error fetching API destinations for EventBridge bus {event_bus_name}: {e}")
                     bus_data['api_destinations'] = []
 
                 # Get connections (no pagination)
@@ -1570,11 +1870,11 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                             )
                             connections.append(connection_details.get('Connection', {}))
                         except Exception as e:
-                            print(f"Error fetching details for connection {connection.get('Name')}: {e}")
+                            _log(f"Error fetching details for connection {connection.get('Name')}: {e}")
                             connections.append(connection)
                     bus_data['connections'] = connections
                 except Exception as e:
-                    print(f"Error fetching connections for EventBridge bus {event_bus_name}: {e}")
+                    _log(f"Error fetching connections for EventBridge bus {event_bus_name}: {e}")
                     bus_data['connections'] = []
 
                 # Get endpoints (no pagination)
@@ -1588,11 +1888,11 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                             )
                             endpoints.append(endpoint_details.get('Endpoint', {}))
                         except Exception as e:
-                            print(f"Error fetching details for endpoint {endpoint.get('Name')}: {e}")
+                            _log(f"Error fetching details for endpoint {endpoint.get('Name')}: {e}")
                             endpoints.append(endpoint)
                     bus_data['endpoints'] = endpoints
                 except Exception as e:
-                    print(f"Error fetching endpoints for EventBridge bus {event_bus_name}: {e}")
+                    _log(f"Error fetching endpoints for EventBridge bus {event_bus_name}: {e}")
                     bus_data['endpoints'] = []
 
                 # Get event sources (no pagination)
@@ -1606,11 +1906,11 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                             )
                             event_sources.append(source_details.get('EventSource', {}))
                         except Exception as e:
-                            print(f"Error fetching details for event source {source.get('Name')}: {e}")
+                            _log(f"Error fetching details for event source {source.get('Name')}: {e}")
                             event_sources.append(source)
                     bus_data['event_sources'] = event_sources
                 except Exception as e:
-                    print(f"Error fetching event sources for EventBridge bus {event_bus_name}: {e}")
+                    _log(f"Error fetching event sources for EventBridge bus {event_bus_name}: {e}")
                     bus_data['event_sources'] = []
 
                 # Get partner event sources (no pagination)
@@ -1624,11 +1924,11 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                             )
                             partner_sources.append(source_details.get('PartnerEventSource', {}))
                         except Exception as e:
-                            print(f"Error fetching details for partner event source {source.get('Name')}: {e}")
+                            _log(f"Error fetching details for partner event source {source.get('Name')}: {e}")
                             partner_sources.append(source)
                     bus_data['partner_event_sources'] = partner_sources
                 except Exception as e:
-                    print(f"Error fetching partner event sources for EventBridge bus {event_bus_name}: {e}")
+                    _log(f"Error fetching partner event sources for EventBridge bus {event_bus_name}: {e}")
                     bus_data['partner_event_sources'] = []
 
                 # Get event bus archives (no pagination)
@@ -1642,11 +1942,11 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                             )
                             archives.append(archive_details.get('Archive', {}))
                         except Exception as e:
-                            print(f"Error fetching details for archive {archive.get('ArchiveName')}: {e}")
+                            _log(f"Error fetching details for archive {archive.get('ArchiveName')}: {e}")
                             archives.append(archive)
                     bus_data['archives'] = archives
                 except Exception as e:
-                    print(f"Error fetching archives for EventBridge bus {event_bus_name}: {e}")
+                    _log(f"Error fetching archives for EventBridge bus {event_bus_name}: {e}")
                     bus_data['archives'] = []
 
                 # Get event bus replays (no pagination)
@@ -1660,11 +1960,11 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                             )
                             replays.append(replay_details.get('Replay', {}))
                         except Exception as e:
-                            print(f"Error fetching details for replay {replay.get('ReplayName')}: {e}")
+                            _log(f"Error fetching details for replay {replay.get('ReplayName')}: {e}")
                             replays.append(replay)
                     bus_data['replays'] = replays
                 except Exception as e:
-                    print(f"Error fetching replays for EventBridge bus {event_bus_name}: {e}")
+                    _log(f"Error fetching replays for EventBridge bus {event_bus_name}: {e}")
                     bus_data['replays'] = []
 
                 # Store event bus configuration
@@ -1682,7 +1982,7 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                             for rule in rule_page.get('Rules', []):
                                 rule_names.append(rule.get('Name'))
                     except Exception as e:
-                        print(f"Error listing rules for event bus {event_bus_name}: {e}")
+                        _log(f"Error listing rules for event bus {event_bus_name}: {e}")
 
                 # Fetch rule details
                 rule_index = 0
@@ -1703,7 +2003,7 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                                 )
                                 rule_data['tags'] = rule_tags.get('Tags', [])
                             except Exception as e:
-                                print(f"Error fetching tags for rule {rule_name}: {e}")
+                                _log(f"Error fetching tags for rule {rule_name}: {e}")
                                 rule_data['tags'] = []
 
                         # Store rule configuration
@@ -1726,28 +2026,28 @@ def fetch_eventbridge_config(event_bus_configs, use_custom_identifier=False):
                                         **target
                                     }
                         except Exception as e:
-                            print(f"Error fetching targets for rule {rule_name}: {e}")
+                            _log(f"Error fetching targets for rule {rule_name}: {e}")
 
                     except Exception as e:
-                        print(f"Error fetching rule {rule_name}: {e}")
+                        _log(f"Error fetching rule {rule_name}: {e}")
 
             except events_client.exceptions.ResourceNotFoundException:
-                print(f"EventBridge bus not found: {event_bus_name}")
+                _log(f"EventBridge bus not found: {event_bus_name}")
                 continue
             except Exception as e:
-                print(f"Error processing event bus {event_bus_name}: {e}")
+                _log(f"Error processing event bus {event_bus_name}: {e}")
                 continue
 
         return all_eventbridge_configs
     except Exception as e:
-        print(f"Error fetching EventBridge configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching EventBridge configurations: {e}")
+        return all_eventbridge_configs
 
 def find_eventbridge_buses(team_tag_key='ApplicationShortName', team_tag_value=''):
     """
     Finds all EventBridge event buses for a given ApplicationShortName tag value.
     """
-    events_client = boto3.client('events', region_name='us-east-1')
+    events_client = get_client('events')
     matching_buses = []
 
     try:
@@ -1767,15 +2067,15 @@ def find_eventbridge_buses(team_tag_key='ApplicationShortName', team_tag_value='
                         if tag['Key'] == team_tag_key and tag['Value'] == team_tag_value:
                             matching_buses.append(bus.get('Name'))
                 except Exception as e:
-                    print(f"Error fetching tags for event bus {bus.get('Name')}: {e}")
+                    _log(f"Error fetching tags for event bus {bus.get('Name')}: {e}")
                     continue
 
         if not matching_buses:
-            print(f"No EventBridge buses found for {team_tag_key} = {team_tag_value}")
+            _log(f"No EventBridge buses found for {team_tag_key} = {team_tag_value}")
         return matching_buses
     except Exception as e:
-        print(f"Error finding EventBridge buses: {e}")
-        sys.exit(1)
+        _log(f"Error finding EventBridge buses: {e}")
+        return matching_buses
 
 def fetch_dynamodb_config(identifier, use_table_names=False):
     """
@@ -1784,7 +2084,7 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
     Includes comprehensive details such as global secondary indexes, local secondary indexes,
     stream specifications, provisioned throughput, and other important table attributes.
     """
-    dynamodb_client = boto3.client('dynamodb', region_name='us-east-1')
+    dynamodb_client = get_client('dynamodb')
     all_dynamodb_configs = {}
     table_index = 0
 
@@ -1810,11 +2110,11 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
                         )
                         table_config['ContinuousBackups'] = backup_response.get('ContinuousBackupsDescription', {})
                     except Exception as backup_error:
-                        print(f"Warning: Could not fetch continuous backup info for {table_name}: {backup_error}")
+                        _log(f"Warning: Could not fetch continuous backup info for {table_name}: {backup_error}")
                     
                     # Get auto scaling configuration if available
                     try:
-                        application_auto_scaling = boto3.client('application-autoscaling', region_name='us-east-1')
+                        application_auto_scaling = get_client('application-autoscaling')
                         scaling_policies = application_auto_scaling.describe_scaling_policies(
                             ServiceNamespace='dynamodb',
                             ResourceId=f'table/{table_name}'
@@ -1822,7 +2122,7 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
                         if scaling_policies.get('ScalingPolicies'):
                             table_config['AutoScalingPolicies'] = scaling_policies.get('ScalingPolicies', [])
                     except Exception as scaling_error:
-                        print(f"Warning: Could not fetch auto scaling info for {table_name}: {scaling_error}")
+                        _log(f"Warning: Could not fetch auto scaling info for {table_name}: {scaling_error}")
                     
                     # Get table's TTL settings
                     try:
@@ -1831,7 +2131,7 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
                         )
                         table_config['TimeToLiveDescription'] = ttl_response.get('TimeToLiveDescription', {})
                     except Exception as ttl_error:
-                        print(f"Warning: Could not fetch TTL info for {table_name}: {ttl_error}")
+                        _log(f"Warning: Could not fetch TTL info for {table_name}: {ttl_error}")
                     
                     # Store with indexed key and include original table name in config
                     all_dynamodb_configs[f"dynamodb_table_{table_index}"] = {
@@ -1853,10 +2153,10 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
                         pass
                     
                 except dynamodb_client.exceptions.ResourceNotFoundException:
-                    print(f"DynamoDB table not found: {table_name}")
+                    _log(f"DynamoDB table not found: {table_name}")
                     continue
                 except Exception as e:
-                    print(f"Error fetching configuration for DynamoDB table {table_name}: {e}")
+                    _log(f"Error fetching configuration for DynamoDB table {table_name}: {e}")
                     continue
         else:
             # Fetch all tables and filter by ApplicationShortName tag - use table names as keys
@@ -1884,11 +2184,11 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
                                 )
                                 table_config['ContinuousBackups'] = backup_response.get('ContinuousBackupsDescription', {})
                             except Exception as backup_error:
-                                print(f"Warning: Could not fetch continuous backup info for {table_name}: {backup_error}")
+                                _log(f"Warning: Could not fetch continuous backup info for {table_name}: {backup_error}")
                             
                             # Get auto scaling configuration if available
                             try:
-                                application_auto_scaling = boto3.client('application-autoscaling', region_name='us-east-1')
+                                application_auto_scaling = get_client('application-autoscaling')
                                 scaling_policies = application_auto_scaling.describe_scaling_policies(
                                     ServiceNamespace='dynamodb',
                                     ResourceId=f'table/{table_name}'
@@ -1896,7 +2196,7 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
                                 if scaling_policies.get('ScalingPolicies'):
                                     table_config['AutoScalingPolicies'] = scaling_policies.get('ScalingPolicies', [])
                             except Exception as scaling_error:
-                                print(f"Warning: Could not fetch auto scaling info for {table_name}: {scaling_error}")
+                                _log(f"Warning: Could not fetch auto scaling info for {table_name}: {scaling_error}")
                             
                             # Get table's TTL settings
                             try:
@@ -1905,7 +2205,7 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
                                 )
                                 table_config['TimeToLiveDescription'] = ttl_response.get('TimeToLiveDescription', {})
                             except Exception as ttl_error:
-                                print(f"Warning: Could not fetch TTL info for {table_name}: {ttl_error}")
+                                _log(f"Warning: Could not fetch TTL info for {table_name}: {ttl_error}")
                             
                             # Store the table configuration
                             all_dynamodb_configs[table_name] = table_config
@@ -1920,16 +2220,16 @@ def fetch_dynamodb_config(identifier, use_table_names=False):
                                 # Not a global table, skip silently
                                 pass
                     except Exception as e:
-                        print(f"Error processing DynamoDB table {table_name}: {e}")
+                        _log(f"Error processing DynamoDB table {table_name}: {e}")
                         continue
 
         if not all_dynamodb_configs:
-            print(f"No DynamoDB tables found for {'table names' if use_table_names else 'ApplicationShortName'} = {identifier}")
+            _log(f"No DynamoDB tables found for {'table names' if use_table_names else 'ApplicationShortName'} = {identifier}")
 
         return all_dynamodb_configs
     except Exception as e:
-        print(f"Error fetching DynamoDB configurations: {e}")
-        sys.exit(1)
+        _log(f"Error fetching DynamoDB configurations: {e}")
+        return all_dynamodb_configs
 
 def fetch_athena_config(identifier, use_workgroup_names=False):
     """
@@ -1937,7 +2237,7 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
     Returns workgroups with indexed keys or workgroup names as keys based on the mode.
     Includes details about workgroups, named queries, data catalogs, and database metadata.
     """
-    athena_client = boto3.client('athena', region_name='us-east-1')
+    athena_client = get_client('athena')
     all_athena_configs = {}
     workgroup_index = 0
 
@@ -1958,7 +2258,7 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
                         )
                         workgroup_config['Tags'] = tags_response.get('Tags', [])
                     except Exception as tag_error:
-                        print(f"Warning: Could not fetch tags for workgroup {workgroup_name}: {tag_error}")
+                        _log(f"Warning: Could not fetch tags for workgroup {workgroup_name}: {tag_error}")
                         workgroup_config['Tags'] = []
                     
                     # Get prepared statements
@@ -1974,11 +2274,11 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
                                     )
                                     prepared_statements.append(stmt_details.get('PreparedStatement', {}))
                                 except Exception as e:
-                                    print(f"Error fetching prepared statement {stmt.get('StatementName')}: {e}")
+                                    _log(f"Error fetching prepared statement {stmt.get('StatementName')}: {e}")
                                     prepared_statements.append(stmt)
                         workgroup_config['PreparedStatements'] = prepared_statements
                     except Exception as e:
-                        print(f"Error listing prepared statements for workgroup {workgroup_name}: {e}")
+                        _log(f"Error listing prepared statements for workgroup {workgroup_name}: {e}")
                         workgroup_config['PreparedStatements'] = []
                     
                     # Get named queries (limited to recent ones to avoid excessive API calls)
@@ -1991,13 +2291,13 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
                                     query_details = athena_client.get_named_query(NamedQueryId=query_id)
                                     named_queries.append(query_details.get('NamedQuery', {}))
                                 except Exception as e:
-                                    print(f"Error fetching named query {query_id}: {e}")
+                                    _log(f"Error fetching named query {query_id}: {e}")
                             # Limit to 20 named queries to avoid excessive API calls
                             if len(named_queries) >= 20:
                                 break
                         workgroup_config['NamedQueries'] = named_queries
                     except Exception as e:
-                        print(f"Error listing named queries for workgroup {workgroup_name}: {e}")
+                        _log(f"Error listing named queries for workgroup {workgroup_name}: {e}")
                         workgroup_config['NamedQueries'] = []
                     
                     # Store with indexed key and include original workgroup name in config
@@ -2007,10 +2307,10 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
                     }
                     
                 except athena_client.exceptions.InvalidRequestException:
-                    print(f"Athena workgroup not found: {workgroup_name}")
+                    _log(f"Athena workgroup not found: {workgroup_name}")
                     continue
                 except Exception as e:
-                    print(f"Error fetching configuration for Athena workgroup {workgroup_name}: {e}")
+                    _log(f"Error fetching configuration for Athena workgroup {workgroup_name}: {e}")
                     continue
         else:
             # Fetch all workgroups and filter by ApplicationShortName tag
@@ -2038,7 +2338,7 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
                                     has_matching_tag = True
                                     break
                         except Exception as tag_error:
-                            print(f"Warning: Could not fetch tags for workgroup {workgroup_name}: {tag_error}")
+                            _log(f"Warning: Could not fetch tags for workgroup {workgroup_name}: {tag_error}")
                             workgroup_config['Tags'] = []
                         
                         if has_matching_tag:
@@ -2055,11 +2355,11 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
                                             )
                                             prepared_statements.append(stmt_details.get('PreparedStatement', {}))
                                         except Exception as e:
-                                            print(f"Error fetching prepared statement {stmt.get('StatementName')}: {e}")
+                                            _log(f"Error fetching prepared statement {stmt.get('StatementName')}: {e}")
                                             prepared_statements.append(stmt)
                                 workgroup_config['PreparedStatements'] = prepared_statements
                             except Exception as e:
-                                print(f"Error listing prepared statements for workgroup {workgroup_name}: {e}")
+                                _log(f"Error listing prepared statements for workgroup {workgroup_name}: {e}")
                                 workgroup_config['PreparedStatements'] = []
                             
                             # Get named queries (limited to recent ones to avoid excessive API calls)
@@ -2072,20 +2372,20 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
                                             query_details = athena_client.get_named_query(NamedQueryId=query_id)
                                             named_queries.append(query_details.get('NamedQuery', {}))
                                         except Exception as e:
-                                            print(f"Error fetching named query {query_id}: {e}")
+                                            _log(f"Error fetching named query {query_id}: {e}")
                                     # Limit to 20 named queries to avoid excessive API calls
                                     if len(named_queries) >= 20:
                                         break
                                 workgroup_config['NamedQueries'] = named_queries
                             except Exception as e:
-                                print(f"Error listing named queries for workgroup {workgroup_name}: {e}")
+                                _log(f"Error listing named queries for workgroup {workgroup_name}: {e}")
                                 workgroup_config['NamedQueries'] = []
                             
                             # Store the workgroup configuration
                             all_athena_configs[workgroup_name] = workgroup_config
                             
                     except Exception as e:
-                        print(f"Error processing Athena workgroup {workgroup_name}: {e}")
+                        _log(f"Error processing Athena workgroup {workgroup_name}: {e}")
                         continue
         
         # Get data catalogs (regardless of mode)
@@ -2112,19 +2412,19 @@ def fetch_athena_config(identifier, use_workgroup_names=False):
                                     db_key = f"{catalog_key}/database_{db_index}" if use_workgroup_names else f"catalog/{catalog_name}/database/{db_name}"
                                     all_athena_configs[db_key] = database
                         except Exception as e:
-                            print(f"Error listing databases for catalog {catalog_name}: {e}")
+                            _log(f"Error listing databases for catalog {catalog_name}: {e}")
                     except Exception as e:
-                        print(f"Error fetching data catalog {catalog_name}: {e}")
+                        _log(f"Error fetching data catalog {catalog_name}: {e}")
             
         except Exception as e:
-            print(f"Error listing data catalogs: {e}")
+            _log(f"Error listing data catalogs: {e}")
 
         if not all_athena_configs:
-            print(f"No Athena resources found for {'workgroup names' if use_workgroup_names else 'ApplicationShortName'} = {identifier}")
+            _log(f"No Athena resources found for {'workgroup names' if use_workgroup_names else 'ApplicationShortName'} = {identifier}")
             
         return all_athena_configs
     except Exception as e:
-        print(f"Error fetching Athena configurations: {e}")
+        _log(f"Error fetching Athena configurations: {e}")
         return {}
 
 def fetch_service_config(service_name, service_config, ApplicationShortName, use_custom_identifier=False):
@@ -2171,7 +2471,7 @@ def fetch_service_config(service_name, service_config, ApplicationShortName, use
         # Use ApplicationShortName
         if service_name == 'ecs':
             matching_clusters = find_team_cluster(team_tag_key='ApplicationShortName', team_tag_value=ApplicationShortName)
-            ecs_clusters = [{"clusterName": cluster_name} for cluster_name, _ in matching_clusters]
+            ecs_clusters = [{"clusterName": cluster_name, "clusterArn": cluster_arn} for cluster_name, cluster_arn in matching_clusters]
             return fetch_ecs_service_config(ecs_clusters, use_custom_identifier=False) if matching_clusters else {}
         elif service_name == 'rds':
             return fetch_rds_config(ApplicationShortName, use_instance_ids=False)
@@ -2210,7 +2510,7 @@ def fetch_service_config(service_name, service_config, ApplicationShortName, use
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print("Usage: python fetch_aws_config.py <ApplicationShortName> <output_file> <env_index>")
+        _log("Usage: python fetch_aws_config.py <ApplicationShortName> <output_file> <env_index>")
         sys.exit(1)
 
     ApplicationShortName = sys.argv[1]
@@ -2221,7 +2521,7 @@ if __name__ == "__main__":
         # Load environment configuration
         env_config = load_env_config(env_index) if env_index is not None else None
         output_data = {}
-        print("Env config: ", env_config)
+        _log("Env config: ", env_config)
 
         # List of services to fetch
         services = [
@@ -2231,25 +2531,28 @@ if __name__ == "__main__":
 
         if env_config:
             # Fetch configurations for each service
-            for service in services:
-                service_config = env_config.get(service, [])
-                result = fetch_service_config(service, service_config, ApplicationShortName, use_custom_identifier=True)
-                if result is not None:
-                    output_data[service] = result
+            service_configs = [env_config.get(service, []) for service in services]
+            use_custom_identifier = True
         else:
-            print("Env configs not found, fetching configs by ApplicationShortName: ", ApplicationShortName)
+            _log("Env configs not found, fetching configs by ApplicationShortName: ", ApplicationShortName)
             # Fetch all services using ApplicationShortName
-            for service in services:
-                result = fetch_service_config(service, [], ApplicationShortName, use_custom_identifier=False)
-                if result is not None:
-                    output_data[service] = result
+            service_configs = [[] for _ in services]
+            use_custom_identifier = False
+
+        # The services are independent, so they are fetched concurrently; results keep the service order
+        results = map_concurrently(
+            lambda service_args: fetch_service_config(*service_args, ApplicationShortName, use_custom_identifier=use_custom_identifier),
+            zip(services, service_configs)
+        )
+        for service, result in zip(services, results):
+            if result is not None:
+                output_data[service] = result
 
         # Write to the output file
-        with open(output_file, 'w') as f:
-            json.dump(output_data, f, indent=4, cls=DateTimeEncoder)
+        write_output(output_data, output_file)
 
-        print(f"All configurations successfully written to {output_file}")
+        _log(f"All configurations successfully written to {output_file}")
 
     except Exception as e:
-        print(f"Error fetching configurations: {e}")
+        _log(f"Error fetching configurations: {e}")
         sys.exit(1)
\ No newline at end of file